@@ -53,20 +53,23 @@ class InformationController:
         Returns a list of statistics for each region in the world.
 
         Each statistic includes the name of the region, the initial population,
-        and the healthy, recovered, infected, and dead populations.
+        and the healthy, recovered, infected, and dead populations, all taken
+        from the latest snapshot of the world.
 
         Returns:
         ----------
         list of str :
             A list of strings containing the statistics of each region.
         """
+        snapshot = self.__world_model.get_snapshot()
         stats = []
-        for region in self.__world_model.get_regions():
-            stat = f"{region.get_name()}\n"
-            stat += f"{region.get_initial_population():.2f} M\n\n"
-            stat += f"Healthy: {region.get_healthy_population():.2f} M\n"
-            stat += f"Recovered: {region.get_recovered_population():.2f} M\n"
-            stat += f"Infected: {region.get_infected_population():.2f} M\n"
-            stat += f"Dead: {region.get_dead_population():.2f} M\n\n"
+        for name, population in zip(snapshot.get_names(), snapshot.get_populations()):
+            infected, dead, recovered, healthy = population
+            stat = f"{name}\n"
+            stat += f"{population.sum():.2f} M\n\n"
+            stat += f"Healthy: {healthy:.2f} M\n"
+            stat += f"Recovered: {recovered:.2f} M\n"
+            stat += f"Infected: {infected:.2f} M\n"
+            stat += f"Dead: {dead:.2f} M\n\n"
             stats.append(stat)
         return stats
\ No newline at end of file
@@ -1,9 +1,8 @@
 import os
-import random
-import time
 from datetime import date
-from threading import Thread
 from Source.Modeles.Actualites import Actualites
+from Source.Models.Clock import Clock
+from Source.Models.Simulation import Simulation
 
 class MapController:
     """
@@ -14,16 +13,18 @@ class MapController:
 
     Attributes:
     -----------
+    __clock : Clock
+        Game clock running one simulated day every 240 ms.
     __cursor_index : int
         Index for scrolling news.
     __disease_model : Disease
         Model representing the disease.
+    __simulation : Simulation
+        Simulation advancing the epidemic on the world.
     __news_model : News
         Model for managing news and the date.
     __world_model : World
         Model representing the world and its regions.
-    __evolution_thread : Thread
-        Thread to manage population evolution asynchronously.
 
     Methods:
     --------
@@ -31,20 +32,14 @@ class MapController:
         Initializes a new instance of the map controller with the specified 
         disease and world.
 
-    __euler(self):
-        Performs an iteration of the evolution algorithm based on the Euler 
-        method for each region.
+    pause(self):
+        Pauses the game clock.
 
-    __evolve_populations(self):
-        Manages the evolution of populations in all regions continuously.
+    resume(self):
+        Resumes the game clock.
 
-    __infect_neighbors(self):
-        Spreads the infection to neighboring regions based on specified 
-        conditions.
-
-    __get_rates(self, region):
-        Calculates the rates of populations (infected, dead, recovered, healthy) 
-        for a given region.
+    set_speed(self, value):
+        Sets the time scale of the game.
 
     stop_growth_points(self):
         Stops the growth of disease points.
@@ -60,7 +55,7 @@ class MapController:
         Returns the colors representing the state of the regions.
 
     get_date(self):
-        Returns the current date from the news model and increments by one day.
+        Returns the current date from the latest snapshot of the world.
 
     get_disease(self):
         Returns the disease model.
@@ -77,13 +72,16 @@ class MapController:
     get_region_tags(self):
         Returns the names of regions for labeling.
 
+    get_region_stats(self, index):
+        Returns the statistics of a region from the latest snapshot of the world.
+
     get_world_rates(self):
         Calculates the rates of populations (infected, dead, recovered, healthy) 
         for the entire world.
     """
 
-    __slots__ = ["__cursor_index", "__disease_model", "__news_model", "__world_model",
-                 "__evolution_thread"]
+    __slots__ = ["__clock", "__cursor_index", "__disease_model", "__news_model",
+                 "__simulation", "__world_model"]
 
     def __init__(self, disease, world):
         """
@@ -99,112 +97,36 @@ class MapController:
         today = date.today()
         current_date = date(year=1960, month=today.month, day=today.day)
         self.__cursor_index = 0
-        self.__news_model = Actualites(current_date)
+        self.__news_model = Actualites(current_date, world.get_data_cache())
         self.__disease_model = disease
         self.__world_model = world
-        self.__evolution_thread = Thread(target=self.__evolve_populations, daemon=True)
-        self.__evolution_thread.start()
-
-    def __euler(self):
-        """
-        Performs an iteration of the evolution algorithm based on the Euler method.
-        """
-        dt = 0.1
-        for region in self.__world_model.get_regions():
-
-            # Levels
-            levels = [self.__disease_model.get_camouflage(),
-                      self.__disease_model.get_infectivity(),
-                      self.__disease_model.get_lethality(),
-                      self.__disease_model.get_reassembly(),
-                      self.__disease_model.get_heat_resistance(),
-                      self.__disease_model.get_cold_resistance()]
+        self.__simulation = Simulation(disease, world, self.__news_model)
+        self.__clock = Clock()
+        self.__clock.schedule(self.__simulation.step, 0.240)
 
-            # Populations
-            s = region.get_healthy_pop()
-            i = region.get_infected_pop()
-            r = region.get_recovered_pop()
-            m = region.get_dead_pop()
-
-            # Probabilities
-            b = s / region.get_area() * levels[1]
-            g = 1 / levels[0] + 1 / levels[3]
-            d = levels[2]
-
-            g += 1 / levels[5] if region.get_temperature() < 20 else 1 / levels[4]
-            b *= 1
-            g *= 1e-6
-            d *= 1e-6
-
-            print(region.get_name(), b, g, d)
-
-            t = 0
-            while t < 10:
-                t += dt
-                s += dt * (-b * s * i)
-                i += dt * (b * s * i - g * i - d * i)
-                r += dt * (g * i)
-                m += dt * (d * i)
-
-            region.modify_healthy_pop(s)
-            region.modify_infected_pop(i)
-            region.modify_recovered_pop(r)
-            region.modify_dead_pop(m)
-
-    def __evolve_populations(self):
+    def pause(self):
         """
-        Manages the evolution of populations in all regions continuously.
+        Pauses the game clock.
         """
-        a = 0
-        while True:
-            self.__euler()
-            a += 1
-            if a % 4 == 0:
-                a = 0
-                self.__infect_neighbors()
-            time.sleep(0.240)
+        self.__clock.pause()
 
-    def __infect_neighbors(self):
+    def resume(self):
         """
-        Spreads the infection to neighboring regions based on specified conditions.
+        Resumes the game clock.
         """
-        for region in self.__world_model.get_regions():
-            if region.get_infected_pop() / region.get_initial_pop() >= 0.1:
-                if region.get_infected_pop() == 0 and random.randint(0, 99) == 1:
-                    self.__world_model.init_infected_pop(region.get_name())
-                else:
-                    neighbor = random.choice(region.get_neighbors())
-                    if neighbor.get_infected_pop() == 0:
-                        self.__world_model.init_infected_pop(neighbor.get_name())
+        self.__clock.resume()
 
-    def __get_rates(self, region):
+    def set_speed(self, value):
         """
-        Calculates the rates of populations (infected, dead, recovered, healthy) for a given region.
+        Sets the time scale of the game.
 
         Parameters:
         ------------
-        region : Region
-            The region for which the rates are calculated.
-
-        Returns:
-        ----------
-        tuple :
-            A tuple containing the rates of infection, mortality, recovery, and health.
-        """
-        infected = 0
-        dead = 0
-        recovered = 0
-        healthy = 0
-        infected_pop = region.get_infected_pop()
-        dead_pop = region.get_dead_pop()
-        recovered_pop = region.get_recovered_pop()
-        healthy_pop = region.get_healthy_pop()
-        population = infected_pop + dead_pop + recovered_pop + healthy_pop
-        infected = infected_pop / population
-        dead = dead_pop / population
-        recovered = recovered_pop / population
-        healthy = healthy_pop / population
-        return (infected, dead, recovered, healthy)
+        value : float
+            The number of simulated days per 240 ms, or None to simulate as many
+            days as the frame budget allows.
+        """
+        self.__clock.set_speed(value)
 
     def stop_growth_points(self):
         """
@@ -237,32 +159,26 @@ class MapController:
         """
         Returns the colors representing the state of the regions.
 
+        The colors are computed from the latest snapshot of the world, so they
+        all come from the same simulated day.
+
         Returns:
         ----------
         list :
             A list of colors for each region.
         """
-        result = []
-        for region in self.__world_model.get_regions():
-            rates = self.__get_rates(region)
-            r = rates[0] * 255 + rates[1] * 255
-            g = 0
-            b = rates[1] * 255
-            result.append([r, g, b])
-        return result
+        return self.__world_model.get_snapshot().get_colors().tolist()
 
     def get_date(self):
         """
-        Returns the current date from the news model and increments by one day.
+        Returns the current date from the latest snapshot of the world.
 
         Returns:
         ----------
         str :
             The current date as a string.
         """
-        date_string = self.__news_model.get_date()
-        self.__news_model.add_day()
-        return date_string
+        return self.__world_model.get_snapshot().get_date()
 
     def get_disease(self):
         """
@@ -329,6 +245,30 @@ class MapController:
         world_map_path = map_paths.pop()
         return [world_map_path] + map_paths
 
+    def get_region_stats(self, index):
+        """
+        Returns the statistics of a region from the latest snapshot of the world.
+
+        Parameters:
+        ------------
+        index : int
+            The index of the region, in the order of the regions of the world.
+
+        Returns:
+        ----------
+        str :
+            The name of the region and its healthy, infected, recovered and dead
+            populations.
+        """
+        snapshot = self.__world_model.get_snapshot()
+        infected, dead, recovered, healthy = snapshot.get_populations()[index]
+        stat = f"{snapshot.get_names()[index]}\n"
+        stat += f"Healthy: {healthy:.2f} M\n"
+        stat += f"Infected: {infected:.2f} M\n"
+        stat += f"Recovered: {recovered:.2f} M\n"
+        stat += f"Dead: {dead:.2f} M"
+        return stat
+
     def get_world_rates(self):
         """
         Calculates the rates of populations (infected, dead, recovered, healthy) for the entire world.
@@ -338,18 +278,5 @@ class MapController:
         list :
             A list of infection, mortality, recovery, and health rates for the world.
         """
-        infected_pop = 0
-        dead_pop = 0
-        recovered_pop = 0
-        healthy_pop = 0
-        population = 0
-        for region in list(self.__world_model.get_regions()):
-            infected_pop += region.get_infected_pop()
-            dead_pop += region.get_dead_pop()
-            recovered_pop += region.get_recovered_pop()
-            healthy_pop += region.get_healthy_pop()
-            population += region.get_initial_pop()
-        return [infected_pop / population * 100,
-                dead_pop / population * 100,
-                recovered_pop / population * 100,
-                healthy_pop / population * 100]
\ No newline at end of file
+        totals = self.__world_model.get_snapshot().get_populations().sum(axis=0)
+        return (totals / totals.sum() * 100).tolist()
\ No newline at end of file
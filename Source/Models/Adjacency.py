@@ -0,0 +1,219 @@
+import csv
+import os
+import numpy as np
+from PIL import Image
+from Source.Models.CacheFile import CacheFile
+from Source.Models.Region import Region
+
+class Adjacency:
+    """
+    Class computing which regions are neighbors from the map images of the regions.
+
+    Two regions are neighbors when their masks overlap or when one of them, dilated
+    by a disk of the given radius, touches the other. The dilation is computed for
+    all the regions at once by comparing the label image of the regions with
+    shifted copies of itself, so its cost does not depend on the number of regions.
+    The outer frame of one pixel of the images is ignored, since some masks have
+    stray pixels on the edge of the map.
+
+    Links that cannot be seen on the map, such as the ones across oceans, can be
+    added from a file in the format of Data/Neighborhood.csv. Its names are matched
+    to the map images the same way as the world does, regardless of case, word
+    order and of the "Eastern"/"East" style of directions.
+
+    The result is cached in a .npz file next to the map images, which is rebuilt
+    when the map images, the links file or the radius change.
+
+    Attributes:
+    -----------
+    __matrix : numpy.ndarray
+        Symmetric boolean array of shape (regions, regions) telling if two regions
+        are neighbors.
+    __names : list
+        Names of the regions, taken from the names of the map images.
+    __unmatched : list
+        Names of the links file that do not match any map image.
+
+    Methods:
+    --------
+    __init__(map_paths, links_path=None, cache_path=None, radius=4):
+        Initializes the adjacency of the regions, from the cache if it is up to date.
+    __compute(map_paths, radius):
+        Computes the adjacency of the regions from their map images.
+    __add_links(links_path):
+        Adds the links listed in a file to the adjacency of the regions.
+    get_matrix():
+        Returns the adjacency matrix of the regions.
+    get_names():
+        Returns the names of the regions.
+    get_neighbors(name):
+        Returns the names of the neighbors of a region.
+    get_unmatched():
+        Returns the names of the links file that do not match any map image.
+    """
+
+    __slots__ = ["__matrix", "__names", "__unmatched"]
+
+    def __init__(self, map_paths, links_path=None, cache_path=None, radius=4):
+        """
+        Initializes the adjacency of the regions, from the cache if it is up to date.
+
+        Parameters:
+        ------------
+        map_paths : list
+            Paths to the map images of the regions.
+        links_path : str
+            Path to a file listing additional links, in the format of
+            Data/Neighborhood.csv, or None to use the map images only.
+        cache_path : str
+            Path to the .npz file caching the result. Defaults to adjacency.npz next
+            to the map images.
+        radius : int
+            Radius in pixels of the dilation of the masks.
+        """
+        self.__names = [os.path.splitext(os.path.basename(path))[0] for path in map_paths]
+        if cache_path is None:
+            cache_path = os.path.join(os.path.dirname(map_paths[0]), "adjacency.npz")
+        cache_file = CacheFile(cache_path)
+        key = CacheFile.get_key(map_paths + ([links_path] if links_path is not None else []),
+                                radius)
+
+        cache = cache_file.load()
+        if cache is not None and str(cache.get("key")) == key:
+            self.__matrix = cache["matrix"]
+            self.__unmatched = cache["unmatched"].tolist()
+            return
+
+        self.__matrix = self.__compute(map_paths, radius)
+        self.__unmatched = []
+        if links_path is not None:
+            self.__add_links(links_path)
+
+        cache_file.save({"key": key, "matrix": self.__matrix,
+                         "unmatched": np.array(self.__unmatched, dtype=str)}, compressed=True)
+
+    def __compute(self, map_paths, radius):
+        """
+        Computes the adjacency of the regions from their map images.
+
+        Parameters:
+        ------------
+        map_paths : list
+            Paths to the map images of the regions.
+        radius : int
+            Radius in pixels of the dilation of the masks.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Symmetric boolean array of shape (regions, regions) telling if two
+            regions are neighbors.
+        """
+        matrix = np.zeros((len(map_paths) + 1, len(map_paths) + 1), dtype=bool)
+        labels = None
+        for index, path in enumerate(map_paths):
+            with Image.open(path) as image:
+                mask = np.asarray(image.convert("RGBA"))[..., 3] != 0
+            if labels is None:
+                labels = np.zeros(mask.shape, dtype=np.intp)
+            mask[[0, -1], :] = False
+            mask[:, [0, -1]] = False
+            matrix[labels[mask], index + 1] = True
+            labels[mask] = index + 1
+
+        height, width = labels.shape
+        for dy in range(radius + 1):
+            for dx in range(-radius, radius + 1):
+                # Half of the disk is enough since the matrix is made symmetric
+                if (dy == 0 and dx <= 0) or dx * dx + dy * dy > radius * radius:
+                    continue
+                first = labels[:height - dy, max(0, -dx):width - max(0, dx)]
+                second = labels[dy:, max(0, dx):width - max(0, -dx)]
+                contact = (first != second) & (first > 0) & (second > 0)
+                matrix[first[contact], second[contact]] = True
+
+        matrix = matrix[1:, 1:]
+        matrix |= matrix.T
+        np.fill_diagonal(matrix, False)
+        return matrix
+
+    def __add_links(self, links_path):
+        """
+        Adds the links listed in a file to the adjacency of the regions.
+
+        Parameters:
+        ------------
+        links_path : str
+            Path to the file listing the links, in the format of Data/Neighborhood.csv.
+        """
+        indices = {Region.get_key(name): index for index, name in enumerate(self.__names)}
+        with open(links_path, newline="", encoding="utf-8-sig") as csvfile:
+            reader = csv.reader(csvfile, delimiter=":")
+            next(reader)
+            for row in reader:
+                if not row:
+                    continue
+                names = [row[0]] + row[1].split(",")
+                unmatched = [name for name in names if Region.get_key(name) not in indices]
+                self.__unmatched.extend(name for name in unmatched
+                                        if name not in self.__unmatched)
+                if row[0] in unmatched:
+                    continue
+                index = indices[Region.get_key(row[0])]
+                for name in names[1:]:
+                    if name not in unmatched:
+                        self.__matrix[index, indices[Region.get_key(name)]] = True
+                        self.__matrix[indices[Region.get_key(name)], index] = True
+
+    def get_matrix(self):
+        """
+        Returns the adjacency matrix of the regions.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Symmetric boolean array of shape (regions, regions) telling if two
+            regions are neighbors, in the order of the map images.
+        """
+        return self.__matrix
+
+    def get_names(self):
+        """
+        Returns the names of the regions.
+
+        Returns:
+        ----------
+        list :
+            The names of the map images, in their order.
+        """
+        return self.__names
+
+    def get_neighbors(self, name):
+        """
+        Returns the names of the neighbors of a region.
+
+        Parameters:
+        ------------
+        name : str
+            The name of the region, matched regardless of case, word order and of
+            the style of directions.
+
+        Returns:
+        ----------
+        list :
+            The names of the neighboring regions.
+        """
+        keys = [Region.get_key(region_name) for region_name in self.__names]
+        index = keys.index(Region.get_key(name))
+        return [self.__names[neighbor] for neighbor in np.flatnonzero(self.__matrix[index])]
+
+    def get_unmatched(self):
+        """
+        Returns the names of the links file that do not match any map image.
+
+        Returns:
+        ----------
+        list :
+            The names that were skipped, in the order of the file.
+        """
+        return self.__unmatched
\ No newline at end of file
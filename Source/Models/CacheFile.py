@@ -0,0 +1,127 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+import numpy as np
+
+class CacheFile:
+    """
+    Class reading and writing a .npz file caching results derived from other files.
+
+    The cache only saves time, so it never fails: a missing file or one that
+    cannot be read, such as one cut short by a killed process, loads as nothing
+    and the caller rebuilds its result. A failed write is ignored. The file is
+    written to a temporary file in the same directory which then replaces it,
+    so that processes reading or rebuilding it at the same time, such as the
+    workers of an ensemble, never see a partial file.
+
+    Attributes:
+    -----------
+    __path : str
+        Path to the cache file.
+
+    Methods:
+    --------
+    __init__(path):
+        Initializes a new instance of the CacheFile class for the specified path.
+    load():
+        Returns the arrays stored in the cache file.
+    save(arrays, compressed=False):
+        Writes arrays to the cache file.
+    get_path():
+        Returns the path to the cache file.
+    get_key(paths, *values):
+        Returns a key identifying source files and settings.
+    """
+
+    __slots__ = ["__path"]
+
+    def __init__(self, path):
+        """
+        Initializes a new instance of the CacheFile class for the specified path.
+
+        Parameters:
+        ------------
+        path : str
+            The path to the cache file.
+        """
+        self.__path = path
+
+    def load(self):
+        """
+        Returns the arrays stored in the cache file.
+
+        Returns:
+        ----------
+        dict :
+            Dictionary containing the arrays with their name as the key, or None if
+            the file is missing or cannot be read.
+        """
+        if not os.path.exists(self.__path):
+            return None
+        try:
+            with np.load(self.__path) as cache:
+                return {name: cache[name] for name in cache.files}
+        except (OSError, ValueError, zipfile.BadZipFile, EOFError, KeyError):
+            return None
+
+    def save(self, arrays, compressed=False):
+        """
+        Writes arrays to the cache file.
+
+        Parameters:
+        ------------
+        arrays : dict
+            Dictionary containing the arrays to write with their name as the key.
+        compressed : bool
+            Indicates if the arrays are compressed, which suits large images.
+        """
+        temporary_path = None
+        try:
+            handle, temporary_path = tempfile.mkstemp(
+                suffix=".tmp", dir=os.path.dirname(os.path.abspath(self.__path)))
+            with os.fdopen(handle, "wb") as file:
+                (np.savez_compressed if compressed else np.savez)(file, **arrays)
+            os.replace(temporary_path, self.__path)
+        except OSError:
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def get_path(self):
+        """
+        Returns the path to the cache file.
+
+        Returns:
+        ----------
+        str :
+            The path to the cache file.
+        """
+        return self.__path
+
+    @staticmethod
+    def get_key(paths, *values):
+        """
+        Returns a key identifying source files and settings.
+
+        Parameters:
+        ------------
+        paths : list
+            The paths to the source files. Missing files are part of the key.
+        values : tuple
+            Settings the cached result depends on, such as a radius.
+
+        Returns:
+        ----------
+        str :
+            A hash of the settings and of the names, order, sizes and modification
+            times of the files.
+        """
+        digest = hashlib.sha1(repr(values).encode())
+        for path in paths:
+            if os.path.exists(path):
+                stat = os.stat(path)
+                identity = f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};"
+            else:
+                identity = f"{os.path.basename(path)}:missing;"
+            digest.update(identity.encode())
+        return digest.hexdigest()
\ No newline at end of file
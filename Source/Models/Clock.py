@@ -0,0 +1,216 @@
+import heapq
+import itertools
+import time
+from threading import Condition, Thread
+
+class Clock:
+    """
+    Class representing the game clock, which runs periodic tasks in game time.
+
+    The tasks run one after the other on a single thread, which blocks on a
+    condition until the next task is due, the clock is resumed or its speed
+    changes. A paused clock therefore costs no CPU time.
+
+    At maximum speed, the game time jumps straight to the next due task. The
+    tasks then run back to back for a budget of each frame, and the thread
+    sleeps for the rest of the frame so that the interface keeps refreshing.
+
+    Attributes:
+    -----------
+    __budget : float
+        Duration in seconds of each frame during which tasks may run at maximum speed.
+    __condition : threading.Condition
+        Condition used to wake the clock thread on pause, resume, speed change or new task.
+    __counter : itertools.count
+        Counter used to order tasks due at the same time.
+    __elapsed : float
+        Game time in seconds elapsed at the last reference instant.
+    __frame : float
+        Duration in seconds of a frame at maximum speed.
+    __frame_end : float
+        Wall-clock instant at which the budget of the current frame runs out.
+    __paused : bool
+        Indicates if the clock is paused.
+    __reference : float
+        Wall-clock instant from which the game time is measured.
+    __speed : float
+        Number of game seconds elapsing per wall-clock second, or None at maximum speed.
+    __tasks : list
+        Heap of scheduled tasks, as (due time, order, period, callback) tuples.
+    __thread : threading.Thread
+        Thread running the tasks when they are due.
+
+    Methods:
+    --------
+    __init__(frame=0.040, budget=0.030):
+        Initializes a new instance of the Clock class and starts its thread.
+    __get_time():
+        Returns the game time, the condition being held.
+    __run():
+        Thread that runs the tasks when they are due.
+    schedule(callback, period):
+        Schedules a function to run every period seconds of game time.
+    pause():
+        Pauses the clock.
+    resume():
+        Resumes the clock.
+    set_speed(value):
+        Sets the speed multiplier of the clock.
+    get_speed():
+        Returns the speed multiplier of the clock.
+    get_time():
+        Returns the game time in seconds.
+    is_paused():
+        Returns True if the clock is paused.
+    """
+
+    __slots__ = ["__budget", "__condition", "__counter", "__elapsed", "__frame", "__frame_end",
+                 "__paused", "__reference", "__speed", "__tasks", "__thread"]
+
+    def __init__(self, frame=0.040, budget=0.030):
+        """
+        Initializes a new instance of the Clock class and starts its thread.
+
+        Parameters:
+        ------------
+        frame : float
+            The duration in seconds of a frame at maximum speed.
+        budget : float
+            The duration in seconds of each frame during which tasks may run at maximum speed.
+        """
+        self.__budget = budget
+        self.__condition = Condition()
+        self.__counter = itertools.count()
+        self.__elapsed = 0.0
+        self.__frame = frame
+        self.__frame_end = 0.0
+        self.__paused = False
+        self.__reference = time.monotonic()
+        self.__speed = 1.0
+        self.__tasks = []
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __get_time(self):
+        """
+        Returns the game time, the condition being held.
+
+        Returns:
+        ----------
+        float :
+            The game time in seconds.
+        """
+        if self.__paused or self.__speed is None:
+            return self.__elapsed
+        return self.__elapsed + (time.monotonic() - self.__reference) * self.__speed
+
+    def __run(self):
+        """
+        Thread that runs the tasks when they are due.
+        """
+        while True:
+            with self.__condition:
+                while self.__paused or not self.__tasks:
+                    self.__condition.wait()
+                due, _, period, callback = self.__tasks[0]
+                if self.__speed is None:
+                    if time.monotonic() >= self.__frame_end:
+                        self.__condition.wait(self.__frame - self.__budget)
+                        self.__frame_end = time.monotonic() + self.__budget
+                        continue
+                    self.__elapsed = max(self.__elapsed, due)
+                else:
+                    delay = (due - self.__get_time()) / self.__speed
+                    if delay > 0:
+                        self.__condition.wait(delay)
+                        continue
+                heapq.heapreplace(self.__tasks,
+                                  (due + period, next(self.__counter), period, callback))
+            callback()
+
+    def schedule(self, callback, period):
+        """
+        Schedules a function to run every period seconds of game time.
+
+        Parameters:
+        ------------
+        callback : function
+            The function to run, without arguments.
+        period : float
+            The period of the task, in seconds of game time.
+        """
+        with self.__condition:
+            due = self.__get_time() + period
+            heapq.heappush(self.__tasks, (due, next(self.__counter), period, callback))
+            self.__condition.notify()
+
+    def pause(self):
+        """
+        Pauses the clock.
+        """
+        with self.__condition:
+            if not self.__paused:
+                self.__elapsed = self.__get_time()
+                self.__paused = True
+                self.__condition.notify()
+
+    def resume(self):
+        """
+        Resumes the clock.
+        """
+        with self.__condition:
+            if self.__paused:
+                self.__reference = time.monotonic()
+                self.__paused = False
+                self.__condition.notify()
+
+    def set_speed(self, value):
+        """
+        Sets the speed multiplier of the clock.
+
+        Parameters:
+        ------------
+        value : float
+            The number of game seconds elapsing per wall-clock second, which must be
+            positive, or None to run the tasks as fast as the frame budget allows.
+        """
+        with self.__condition:
+            self.__elapsed = self.__get_time()
+            self.__reference = time.monotonic()
+            self.__speed = value
+            self.__condition.notify()
+
+    def get_speed(self):
+        """
+        Returns the speed multiplier of the clock.
+
+        Returns:
+        ----------
+        float :
+            The number of game seconds elapsing per wall-clock second, or None at
+            maximum speed.
+        """
+        return self.__speed
+
+    def get_time(self):
+        """
+        Returns the game time in seconds.
+
+        Returns:
+        ----------
+        float :
+            The game time elapsed since the creation of the clock.
+        """
+        with self.__condition:
+            return self.__get_time()
+
+    def is_paused(self):
+        """
+        Returns True if the clock is paused.
+
+        Returns:
+        ----------
+        bool :
+            True if the clock is paused, otherwise False.
+        """
+        return self.__paused
\ No newline at end of file
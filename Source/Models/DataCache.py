@@ -0,0 +1,204 @@
+import csv
+import hashlib
+import os
+import numpy as np
+from Source.Models.CacheFile import CacheFile
+
+class DataCache:
+    """
+    Class reading the data files once and caching their parsed content in a binary file.
+
+    The data files are parsed into a column of names and a column of values, the
+    numeric values being converted to floats, and all of them are stored in a
+    single .npz file next to the data files. Later starts load that file instead
+    of parsing the text again. The cache is used as long as the sizes and
+    modification times of the data files are unchanged; otherwise the contents
+    are hashed, and the files are only parsed again if a hash changed. Missing
+    data files are recorded as such, and only raise an error when they are read.
+
+    Attributes:
+    -----------
+    __tables : dict
+        Dictionary containing the names and values of each data file, with the file
+        name as the key, or None for the missing files.
+
+    Methods:
+    --------
+    __init__(data_path=None, cache_path=None):
+        Initializes the parsed data files, from the cache if it is up to date.
+    __get_hashes(data_path):
+        Returns the hashes of the contents of the data files.
+    __parse(data_path):
+        Parses the data files.
+    __save(cache_file, key, hashes):
+        Writes the parsed data files and their identification to the cache.
+    get_names(file_name):
+        Returns the first column of a data file.
+    get_values(file_name):
+        Returns the second column of a data file.
+    """
+
+    __slots__ = ["__tables"]
+
+    # Delimiter of each data file, and whether its second column holds numbers
+    __FILES = {"Population.csv": (",", True), "Area.csv": (",", True),
+               "Temperature.csv": (",", True), "Neighborhood.csv": (":", False),
+               "News.csv": (";", False)}
+
+    def __init__(self, data_path=None, cache_path=None):
+        """
+        Initializes the parsed data files, from the cache if it is up to date.
+
+        Parameters:
+        ------------
+        data_path : str
+            The directory containing the data files. Defaults to Data.
+        cache_path : str
+            The path to the cache file. Defaults to cache.npz in the data directory.
+        """
+        if data_path is None:
+            root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+            data_path = os.path.join(root, "Data")
+        if cache_path is None:
+            cache_path = os.path.join(data_path, "cache.npz")
+        cache_file = CacheFile(cache_path)
+        key = CacheFile.get_key([os.path.join(data_path, file_name) for file_name in self.__FILES])
+
+        cache = cache_file.load()
+        if cache is not None and "key" in cache and "hashes" in cache:
+            hashes = cache["hashes"].tolist()
+            if str(cache["key"]) == key or hashes == self.__get_hashes(data_path):
+                self.__tables = {file_name: (cache[f"{file_name}/names"].tolist(),
+                                             cache[f"{file_name}/values"])
+                                 if f"{file_name}/names" in cache else None
+                                 for file_name in self.__FILES}
+                if str(cache["key"]) != key:
+                    self.__save(cache_file, key, hashes)
+                return
+
+        self.__tables = self.__parse(data_path)
+        self.__save(cache_file, key, self.__get_hashes(data_path))
+
+    def __get_hashes(self, data_path):
+        """
+        Returns the hashes of the contents of the data files.
+
+        Parameters:
+        ------------
+        data_path : str
+            The directory containing the data files.
+
+        Returns:
+        ----------
+        list :
+            The SHA-1 hash of each data file, or "missing", in the order of __FILES.
+        """
+        hashes = []
+        for file_name in self.__FILES:
+            file_path = os.path.join(data_path, file_name)
+            if not os.path.exists(file_path):
+                hashes.append("missing")
+                continue
+            with open(file_path, "rb") as file:
+                hashes.append(hashlib.sha1(file.read()).hexdigest())
+        return hashes
+
+    def __parse(self, data_path):
+        """
+        Parses the data files.
+
+        Parameters:
+        ------------
+        data_path : str
+            The directory containing the data files.
+
+        Returns:
+        ----------
+        dict :
+            Dictionary containing the list of names and the array of values of each
+            data file, with the file name as the key, or None for the missing files.
+        """
+        tables = {}
+        for file_name, (delimiter, numeric) in self.__FILES.items():
+            file_path = os.path.join(data_path, file_name)
+            if not os.path.exists(file_path):
+                tables[file_name] = None
+                continue
+            with open(file_path, newline="", encoding="utf-8-sig") as csvfile:
+                reader = csv.reader(csvfile, delimiter=delimiter)
+                next(reader)
+                rows = [row for row in reader if row]
+            values = [row[1] if len(row) > 1 else "" for row in rows]
+            if numeric:
+                values = np.array([value.replace("\u202f", "") for value in values], dtype=float)
+            else:
+                values = np.array(values, dtype=str)
+            tables[file_name] = ([row[0] for row in rows], values)
+        return tables
+
+    def __save(self, cache_file, key, hashes):
+        """
+        Writes the parsed data files and their identification to the cache.
+
+        Parameters:
+        ------------
+        cache_file : CacheFile
+            The cache file.
+        key : str
+            The key identifying the names, sizes and modification times of the data files.
+        hashes : list
+            The hashes of the contents of the data files.
+        """
+        arrays = {"key": key, "hashes": np.array(hashes, dtype=str)}
+        for file_name, table in self.__tables.items():
+            if table is not None:
+                arrays[f"{file_name}/names"] = np.array(table[0], dtype=str)
+                arrays[f"{file_name}/values"] = table[1]
+        cache_file.save(arrays)
+
+    def get_names(self, file_name):
+        """
+        Returns the first column of a data file.
+
+        Parameters:
+        ------------
+        file_name : str
+            The name of the data file, such as "Population.csv".
+
+        Returns:
+        ----------
+        list :
+            The names of the rows, without the header.
+
+        Raises:
+        ----------
+        FileNotFoundError :
+            If the data file is missing.
+        """
+        if self.__tables[file_name] is None:
+            raise FileNotFoundError(f"No data file named '{file_name}'")
+        return self.__tables[file_name][0]
+
+    def get_values(self, file_name):
+        """
+        Returns the second column of a data file.
+
+        Parameters:
+        ------------
+        file_name : str
+            The name of the data file, such as "Population.csv".
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            The values of the rows, as floats for the population, area and temperature
+            files and as strings otherwise.
+
+        Raises:
+        ----------
+        FileNotFoundError :
+            If the data file is missing.
+        """
+        if self.__tables[file_name] is None:
+            raise FileNotFoundError(f"No data file named '{file_name}'")
+        return self.__tables[file_name][1]
\ No newline at end of file
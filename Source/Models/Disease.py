@@ -1,5 +1,4 @@
-import time
-from threading import Thread
+import weakref
 
 class Disease:
     """
@@ -18,19 +17,27 @@ class Disease:
         3 : Reassembly level
         4 : Heat resistance level
         5 : Cold resistance level
+    __listeners : list
+        Functions called whenever the levels of the disease change. Methods are held
+        through weak references, so that the objects listening, such as the engines
+        of finished simulations, are not kept alive by the disease.
     __name : str
         Name of the disease.
     __points : int
         Evolution points of the disease.
-    __points_thread : threading.Thread
-        Thread to automatically increase the disease points.
 
     Methods:
     --------
-    __init__(name):
-        Initializes a new instance of the Disease class with the specified name.
-    __increase_points():
-        Thread that automatically increases the disease points.
+    __init__(name, levels=None):
+        Initializes a new instance of the Disease class with the specified name and levels.
+    __notify():
+        Calls the listeners after a change of the levels.
+    add_listener(listener):
+        Registers a function to call whenever the levels of the disease change.
+    remove_listener(listener):
+        Unregisters a function called whenever the levels of the disease change.
+    accrue_points():
+        Increases the points by one if the automatic increase of points is enabled.
     stop_points_growth():
         Stops the automatic increase of points.
     increase_camouflage():
@@ -61,40 +68,84 @@ class Disease:
         Returns the heat resistance level of the disease.
     get_cold_resistance():
         Returns the cold resistance level of the disease.
+    get_levels():
+        Returns a copy of the levels of the disease.
     get_points():
         Returns the points of the disease.
     get_name():
         Returns the name of the disease.
     """
 
-    __slots__ = ["__evolution_points", "__levels", "__name", "__points", "__points_thread"]
+    __slots__ = ["__evolution_points", "__levels", "__listeners", "__name", "__points"]
 
-    def __init__(self, name):
+    def __init__(self, name, levels=None):
         """
-        Initializes a new instance of the Disease class with the specified name.
+        Initializes a new instance of the Disease class with the specified name and levels.
 
         Parameters:
         ------------
         name : str
             The name of the disease.
+        levels : list
+            The initial levels of the disease, following the indices of __levels.
+            Defaults to level 1 for every characteristic.
         """
         super().__init__()
         self.__evolution_points = False
-        self.__levels = [1, 1, 1, 1, 1, 1]
+        self.__levels = [1, 1, 1, 1, 1, 1] if levels is None else list(levels)
+        self.__listeners = []
         self.__name = name
         self.__points = 0
-        self.__points_thread = Thread(target=self.__increase_points, daemon=True)
-        self.__points_thread.start()
 
-    def __increase_points(self):
+    def __notify(self):
         """
-        Thread that automatically increases the disease points every 10 seconds
-        if the evolution of points is enabled.
+        Calls the listeners after a change of the levels.
         """
-        while True:
-            if self.__evolution_points:
-                self.__points += 1
-                time.sleep(10)
+        # The weak references whose object was collected are dropped on the way
+        self.__listeners = [reference for reference in self.__listeners
+                            if not isinstance(reference, weakref.WeakMethod)
+                            or reference() is not None]
+        for reference in list(self.__listeners):
+            listener = reference() if isinstance(reference, weakref.WeakMethod) else reference
+            if listener is not None:
+                listener()
+
+    def add_listener(self, listener):
+        """
+        Registers a function to call whenever the levels of the disease change.
+
+        Parameters:
+        ------------
+        listener : function
+            The function to call, without arguments. A method is only called as long
+            as its object is alive.
+        """
+        try:
+            self.__listeners.append(weakref.WeakMethod(listener))
+        except TypeError:
+            self.__listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Unregisters a function called whenever the levels of the disease change.
+
+        Parameters:
+        ------------
+        listener : function
+            The function registered with add_listener.
+        """
+        self.__listeners = [reference for reference in self.__listeners
+                            if (reference() if isinstance(reference, weakref.WeakMethod)
+                                else reference) not in (None, listener)]
+
+    def accrue_points(self):
+        """
+        Increases the points by one if the automatic increase of points is enabled.
+
+        Called by the simulation every 42 simulated days.
+        """
+        if self.__evolution_points:
+            self.__points += 1
 
     def stop_points_growth(self):
         """
@@ -107,36 +158,42 @@ class Disease:
         Increases the camouflage level of the disease.
         """
         self.__levels[0] += 1
+        self.__notify()
 
     def increase_infectivity(self):
         """
         Increases the infectivity level of the disease.
         """
         self.__levels[1] += 1
+        self.__notify()
 
     def increase_lethality(self):
         """
         Increases the lethality level of the disease.
         """
         self.__levels[2] += 1
+        self.__notify()
 
     def increase_reassembly(self):
         """
         Increases the reassembly level of the disease.
         """
         self.__levels[3] += 1
+        self.__notify()
 
     def increase_heat_resistance(self):
         """
         Increases the heat resistance level of the disease.
         """
         self.__levels[4] += 1
+        self.__notify()
 
     def increase_cold_resistance(self):
         """
         Increases the cold resistance level of the disease.
         """
         self.__levels[5] += 1
+        self.__notify()
 
     def start_points_growth(self):
         """
@@ -221,6 +278,18 @@ class Disease:
         """
         return self.__levels[5]
 
+    def get_levels(self):
+        """
+        Returns a copy of the levels of the disease.
+
+        Returns:
+        ----------
+        list:
+            The camouflage, infectivity, lethality, reassembly, heat resistance
+            and cold resistance levels of the disease.
+        """
+        return list(self.__levels)
+
     def get_points(self):
         """
         Returns the points of the disease.
@@ -0,0 +1,142 @@
+import numpy as np
+from Source.Models.Integrators import EulerIntegrator
+
+class Engine:
+    """
+    Class to advance the populations of every region of the world in a single array step.
+
+    The populations, areas and temperatures of all regions are stored in contiguous
+    NumPy arrays. Each Region is bound to its row of the population array, so the
+    Region getters and setters read and write the same memory as the engine.
+
+    Attributes:
+    -----------
+    __areas : numpy.ndarray
+        Array containing the area of each region.
+    __coefficients : tuple
+        Cached infectivity level and recovery and death probabilities of every region,
+        updated whenever the disease levels change.
+    __disease_model : Disease
+        Model representing the disease.
+    __integrator : EulerIntegrator or AdaptiveIntegrator
+        Integrator used to advance the populations over a tick.
+    __populations : numpy.ndarray
+        Array of shape (regions, 4) containing the populations of each region.
+        Columns:
+        0 : Infected population
+        1 : Deceased population
+        2 : Recovered population
+        3 : Healthy population
+    __temperatures : numpy.ndarray
+        Array containing the temperature of each region.
+
+    Methods:
+    --------
+    __init__(disease, world, integrator=None):
+        Initializes a new instance of the Engine class with the specified disease, world
+        and integrator.
+    __update_coefficients():
+        Updates the cached coefficients from the current levels of the disease.
+    get_coefficients(levels, temperatures):
+        Calculates the recovery and death probabilities from disease levels.
+    step():
+        Performs an iteration of the evolution algorithm for every region at once.
+    get_populations():
+        Returns the array containing the populations of every region.
+    """
+
+    # The disease only holds a weak reference to the engine listening to it
+    __slots__ = ["__areas", "__coefficients", "__disease_model", "__integrator",
+                 "__populations", "__temperatures", "__weakref__"]
+
+    def __init__(self, disease, world, integrator=None):
+        """
+        Initializes a new instance of the Engine class with the specified disease, world
+        and integrator.
+
+        Parameters:
+        ------------
+        disease : Disease
+            The disease model.
+        world : World
+            The world model.
+        integrator : EulerIntegrator or AdaptiveIntegrator
+            The integrator used to advance the populations over a tick.
+            Defaults to the fixed-step Euler method.
+        """
+        regions = world.get_regions()
+        self.__disease_model = disease
+        self.__integrator = EulerIntegrator() if integrator is None else integrator
+        self.__areas = np.array([region.get_area() for region in regions], dtype=float)
+        self.__temperatures = np.array([region.get_temperature() for region in regions],
+                                       dtype=float)
+        self.__populations = np.array([[region.get_infected_population(),
+                                        region.get_deceased_population(),
+                                        region.get_recovered_population(),
+                                        region.get_healthy_population()]
+                                       for region in regions], dtype=float).reshape(-1, 4)
+        for index, region in enumerate(regions):
+            region.set_population(self.__populations[index])
+        self.__update_coefficients()
+        disease.add_listener(self.__update_coefficients)
+
+    def __update_coefficients(self):
+        """
+        Updates the cached coefficients from the current levels of the disease.
+
+        Called on creation and whenever the disease notifies a change of its levels.
+        """
+        levels = self.__disease_model.get_levels()
+        g, d = Engine.get_coefficients(levels, self.__temperatures)
+        self.__coefficients = (levels[1], g, d)
+
+    @staticmethod
+    def get_coefficients(levels, temperatures):
+        """
+        Calculates the recovery and death probabilities from disease levels.
+
+        These only depend on the disease levels and the climate of the regions,
+        so they can be computed once per disease upgrade. Any leading axes of levels
+        are broadcast against the regions.
+
+        Parameters:
+        ------------
+        levels : list or numpy.ndarray
+            Levels of shape (..., 6), following the indices of the Disease levels.
+        temperatures : numpy.ndarray
+            Temperatures of the regions.
+
+        Returns:
+        ----------
+        tuple :
+            A tuple containing the recovery and death probabilities,
+            each of shape (..., regions).
+        """
+        levels = np.asarray(levels, dtype=float)[..., None]
+
+        g = 1 / levels[..., 0, :] + 1 / levels[..., 3, :] + np.where(
+            temperatures < 20, 1 / levels[..., 5, :], 1 / levels[..., 4, :])
+        d = np.broadcast_to(levels[..., 2, :], g.shape)
+
+        g = g * 1e-6
+        d = d * 1e-6
+        return (g, d)
+
+    def step(self):
+        """
+        Performs an iteration of the evolution algorithm for every region at once.
+        """
+        infectivity, g, d = self.__coefficients
+        b = self.__populations[:, 3] / self.__areas * infectivity
+        self.__populations[:] = self.__integrator.integrate(self.__populations, b, g, d, 10)
+
+    def get_populations(self):
+        """
+        Returns the array containing the populations of every region.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (regions, 4) containing the populations of every region.
+        """
+        return self.__populations
\ No newline at end of file
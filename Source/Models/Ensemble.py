@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Source.Models.Disease import Disease
+from Source.Models.Simulation import Simulation
+from Source.Models.World import World
+
+
+def _simulate(arguments):
+    """
+    Runs a single member of an ensemble in a worker process.
+
+    Parameters:
+    ------------
+    arguments : tuple
+        The name and levels of the disease, the name of the first infected region,
+        the number of days to simulate and the seed of the run.
+
+    Returns:
+    ----------
+    numpy.ndarray :
+        Array of shape (days, regions, 2) containing the infected and deceased
+        populations of every region at the end of each day.
+    """
+    name, levels, region_name, days, seed = arguments
+    world = World()
+    world.initialize_infected_population(region_name)
+    simulation = Simulation(Disease(name, levels), world, seed=seed)
+    return simulation.run(days)[..., 0:2]
+
+
+class Ensemble:
+    """
+    Class to run independently seeded simulations of the same disease on a process pool.
+
+    The spread between regions is random, so a single run says little about a
+    strategy. The ensemble runs many of them in parallel, one per task, and
+    summarizes them as quantile bands.
+
+    Attributes:
+    -----------
+    __disease_model : Disease
+        Model representing the disease, whose current levels are simulated.
+    __region_name : str
+        Name of the first infected region.
+    __seed : int
+        Seed from which the seeds of every run are derived.
+
+    Methods:
+    --------
+    __init__(disease, region_name, seed=None):
+        Initializes a new instance of the Ensemble class with the specified disease and region.
+    run(runs, days, quantiles=(0.05, 0.5, 0.95), workers=None):
+        Runs the simulations and returns the quantile bands of infected and dead populations.
+    """
+
+    __slots__ = ["__disease_model", "__region_name", "__seed"]
+
+    def __init__(self, disease, region_name, seed=None):
+        """
+        Initializes a new instance of the Ensemble class with the specified disease and region.
+
+        Parameters:
+        ------------
+        disease : Disease
+            The disease model.
+        region_name : str
+            The name of the first infected region.
+        seed : int
+            The seed from which the seeds of every run are derived, for reproducible ensembles.
+        """
+        self.__disease_model = disease
+        self.__region_name = region_name
+        self.__seed = seed
+
+    def run(self, runs, days, quantiles=(0.05, 0.5, 0.95), workers=None):
+        """
+        Runs the simulations and returns the quantile bands of infected and dead populations.
+
+        Parameters:
+        ------------
+        runs : int
+            The number of simulations to run.
+        days : int
+            The number of days to simulate in each run.
+        quantiles : tuple
+            The quantiles to compute for each day and region.
+        workers : int
+            The number of worker processes. Defaults to the number of cores.
+
+        Returns:
+        ----------
+        tuple :
+            A tuple containing the infected and dead quantile bands, each an array
+            of shape (quantiles, days, regions).
+        """
+        workers = os.cpu_count() if workers is None else workers
+        seeds = np.random.SeedSequence(self.__seed).generate_state(runs)
+        arguments = [(self.__disease_model.get_name(), self.__disease_model.get_levels(),
+                      self.__region_name, days, int(seed)) for seed in seeds]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, runs // (4 * workers))
+            results = np.stack(list(executor.map(_simulate, arguments, chunksize=chunksize)))
+
+        bands = np.quantile(results, quantiles, axis=0)
+        return (bands[..., 0], bands[..., 1])
\ No newline at end of file
@@ -0,0 +1,205 @@
+import numpy as np
+
+class EulerIntegrator:
+    """
+    Class integrating the populations with the fixed-step Euler method.
+
+    The compartments are updated one after the other within each step, each update
+    using the values already updated before it, as the original game loop did.
+
+    Attributes:
+    -----------
+    __dt : float
+        Duration of a single Euler step.
+
+    Methods:
+    --------
+    __init__(dt=0.1):
+        Initializes a new instance of the EulerIntegrator class with the specified step.
+    integrate(populations, b, g, d, horizon):
+        Integrates the populations over the specified horizon.
+    """
+
+    __slots__ = ["__dt"]
+
+    def __init__(self, dt=0.1):
+        """
+        Initializes a new instance of the EulerIntegrator class with the specified step.
+
+        Parameters:
+        ------------
+        dt : float
+            The duration of a single Euler step.
+        """
+        self.__dt = dt
+
+    def integrate(self, populations, b, g, d, horizon):
+        """
+        Integrates the populations over the specified horizon.
+
+        Parameters:
+        ------------
+        populations : numpy.ndarray
+            Array of shape (..., 4) containing the infected, deceased, recovered
+            and healthy populations.
+        b : numpy.ndarray
+            Infection probabilities, broadcastable to populations[..., 0].
+        g : numpy.ndarray
+            Recovery probabilities, broadcastable to populations[..., 0].
+        d : numpy.ndarray
+            Death probabilities, broadcastable to populations[..., 0].
+        horizon : float
+            The duration to integrate over.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of the same shape as populations containing the new populations.
+        """
+        i, m, r, s = np.moveaxis(populations, -1, 0).copy()
+
+        dt = self.__dt
+        t = 0
+        while t < horizon:
+            t += dt
+            s += dt * (-b * s * i)
+            i += dt * (b * s * i - g * i - d * i)
+            r += dt * (g * i)
+            m += dt * (d * i)
+
+        return np.stack((i, m, r, s), axis=-1)
+
+
+class AdaptiveIntegrator:
+    """
+    Class integrating the populations with an adaptive-step Runge-Kutta method.
+
+    Uses the Bogacki-Shampine 3(2) embedded pair. Each region keeps its own step
+    size, so dormant regions cover the horizon in a few large steps while regions
+    in explosive growth take small ones. Steps that would make a population
+    negative are rejected and retried with a smaller step.
+
+    Attributes:
+    -----------
+    __atol : float
+        Absolute tolerance of the local error, in millions of people.
+    __rtol : float
+        Relative tolerance of the local error.
+    __steps : numpy.ndarray
+        Last accepted step size of each region, reused by the next integration.
+
+    Methods:
+    --------
+    __init__(rtol=1e-4, atol=1e-8):
+        Initializes a new instance of the AdaptiveIntegrator class with the specified tolerances.
+    __derivatives(y, b, g, d):
+        Returns the derivatives of the populations.
+    integrate(populations, b, g, d, horizon):
+        Integrates the populations over the specified horizon.
+    """
+
+    __slots__ = ["__atol", "__rtol", "__steps"]
+
+    def __init__(self, rtol=1e-4, atol=1e-8):
+        """
+        Initializes a new instance of the AdaptiveIntegrator class with the specified tolerances.
+
+        Parameters:
+        ------------
+        rtol : float
+            The relative tolerance of the local error.
+        atol : float
+            The absolute tolerance of the local error, in millions of people.
+        """
+        self.__atol = atol
+        self.__rtol = rtol
+        self.__steps = None
+
+    def __derivatives(self, y, b, g, d):
+        """
+        Returns the derivatives of the populations.
+
+        Parameters:
+        ------------
+        y : numpy.ndarray
+            Array of shape (n, 4) containing the populations.
+        b : numpy.ndarray
+            Infection probabilities of shape (n,).
+        g : numpy.ndarray
+            Recovery probabilities of shape (n,).
+        d : numpy.ndarray
+            Death probabilities of shape (n,).
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (n, 4) containing the derivatives of the populations.
+        """
+        i = y[:, 0]
+        s = y[:, 3]
+        infections = b * s * i
+        return np.column_stack((infections - g * i - d * i, d * i, g * i, -infections))
+
+    def integrate(self, populations, b, g, d, horizon):
+        """
+        Integrates the populations over the specified horizon.
+
+        Parameters:
+        ------------
+        populations : numpy.ndarray
+            Array of shape (..., 4) containing the infected, deceased, recovered
+            and healthy populations.
+        b : numpy.ndarray
+            Infection probabilities, broadcastable to populations[..., 0].
+        g : numpy.ndarray
+            Recovery probabilities, broadcastable to populations[..., 0].
+        d : numpy.ndarray
+            Death probabilities, broadcastable to populations[..., 0].
+        horizon : float
+            The duration to integrate over.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of the same shape as populations containing the new populations.
+        """
+        shape = populations.shape
+        y = populations.reshape(-1, 4).astype(float)
+        b = np.broadcast_to(b, shape[:-1]).reshape(-1)
+        g = np.broadcast_to(g, shape[:-1]).reshape(-1)
+        d = np.broadcast_to(d, shape[:-1]).reshape(-1)
+
+        if self.__steps is None or self.__steps.shape != b.shape:
+            self.__steps = np.full(b.shape, float(horizon))
+        h = np.minimum(self.__steps, horizon)
+        t = np.zeros(b.shape)
+
+        active = np.flatnonzero(t < horizon)
+        while active.size:
+            ya = y[active]
+            ba, ga, da = b[active], g[active], d[active]
+            ha = np.minimum(h[active], horizon - t[active])[:, None]
+
+            k1 = self.__derivatives(ya, ba, ga, da)
+            k2 = self.__derivatives(ya + 0.5 * ha * k1, ba, ga, da)
+            k3 = self.__derivatives(ya + 0.75 * ha * k2, ba, ga, da)
+            y3 = ya + ha * (2 / 9 * k1 + 1 / 3 * k2 + 4 / 9 * k3)
+            k4 = self.__derivatives(y3, ba, ga, da)
+            y2 = ya + ha * (7 / 24 * k1 + 1 / 4 * k2 + 1 / 3 * k3 + 1 / 8 * k4)
+
+            scale = self.__atol + self.__rtol * np.maximum(np.abs(ya), np.abs(y3))
+            error = np.max(np.abs(y3 - y2) / scale, axis=1)
+            error[np.any(y3 < -self.__atol, axis=1)] = np.inf
+            accepted = error <= 1
+
+            y[active[accepted]] = np.maximum(y3[accepted], 0)
+            t[active[accepted]] = np.where(ha[accepted, 0] >= horizon - t[active[accepted]],
+                                           horizon, t[active[accepted]] + ha[accepted, 0])
+
+            with np.errstate(divide="ignore"):
+                factor = np.clip(0.9 * error ** (-1 / 3), 0.2, 5)
+            h[active] = ha[:, 0] * factor
+            active = active[t[active] < horizon]
+
+        self.__steps = h
+        return y.reshape(shape)
\ No newline at end of file
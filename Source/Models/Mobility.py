@@ -0,0 +1,89 @@
+import numpy as np
+
+class Mobility:
+    """
+    Class to spread the infection between neighboring regions through a weighted flow matrix.
+
+    Instead of seeding a random neighbor once a region passes 10% infected, the
+    infection moves continuously along the links of the world. The flow between
+    two neighboring regions follows a gravity model, growing with the product of
+    their populations and shrinking with their total area, and the flows into
+    each region are normalized to sum to one. Each day, the healthy population of
+    a region is infected at a rate proportional to the weighted infected rate of
+    its neighbors, which is a single sparse matrix-vector product.
+
+    Attributes:
+    -----------
+    __columns : numpy.ndarray
+        Index of the sending region of each link, following the adjacency of the world.
+    __rate : float
+        Share of the healthy population infected per day when every neighbor is fully infected.
+    __rows : numpy.ndarray
+        Index of the receiving region of each link, following the adjacency of the world.
+    __weights : numpy.ndarray
+        Normalized weight of each link.
+
+    Methods:
+    --------
+    __init__(world, rate=0.01):
+        Initializes the flow matrix from the adjacency, populations and areas of the world.
+    spread(populations):
+        Moves the infection along the flow matrix for one day.
+    get_matrix():
+        Returns the flow matrix in coordinate form.
+    """
+
+    __slots__ = ["__columns", "__rate", "__rows", "__weights"]
+
+    def __init__(self, world, rate=0.01):
+        """
+        Initializes the flow matrix from the adjacency, populations and areas of the world.
+
+        Parameters:
+        ------------
+        world : World
+            The world model, whose neighbors are listed in Data/Neighborhood.csv.
+        rate : float
+            The share of the healthy population infected per day when every neighbor
+            is fully infected.
+        """
+        regions = world.get_regions()
+        indptr, indices = world.get_adjacency()
+        totals = np.array([region.get_initial_population() for region in regions], dtype=float)
+        areas = np.array([region.get_area() for region in regions], dtype=float)
+
+        self.__rows = np.repeat(np.arange(len(regions)), np.diff(indptr))
+        self.__columns = indices
+        weights = totals[self.__rows] * totals[self.__columns]
+        weights /= areas[self.__rows] + areas[self.__columns]
+        sums = np.bincount(self.__rows, weights, minlength=len(regions))
+        self.__weights = weights / sums[self.__rows]
+        self.__rate = rate
+
+    def spread(self, populations):
+        """
+        Moves the infection along the flow matrix for one day.
+
+        Parameters:
+        ------------
+        populations : numpy.ndarray
+            Array of shape (regions, 4) containing the populations, following the
+            indices of Region, updated in place.
+        """
+        rates = populations[:, 0] / populations.sum(axis=1)
+        pressure = np.bincount(self.__rows, self.__weights * rates[self.__columns],
+                               minlength=len(populations))
+        infections = np.minimum(self.__rate * pressure, 1) * populations[:, 3]
+        populations[:, 3] -= infections
+        populations[:, 0] += infections
+
+    def get_matrix(self):
+        """
+        Returns the flow matrix in coordinate form.
+
+        Returns:
+        ----------
+        tuple :
+            The receiving regions, the sending regions and the weights of the links.
+        """
+        return (self.__rows, self.__columns, self.__weights)
\ No newline at end of file
@@ -1,6 +1,5 @@
-import csv
-import os
 from datetime import timedelta
+from Source.Models.DataCache import DataCache
 
 class News:
     """
@@ -15,10 +14,10 @@ class News:
 
     Methods:
     --------
-    __init__(date):
+    __init__(date, data_cache=None):
         Initializes a new instance of the News class with the specified date.
-    __initialize_news():
-        Initializes the news by reading the CSV file.
+    __initialize_news(data_cache):
+        Initializes the news from the cache of the data files.
     add_day():
         Adds a day to the current date.
     add_news_item(news_item):
@@ -31,7 +30,7 @@ class News:
 
     __slots__ = ["__date", "__news"]
 
-    def __init__(self, date):
+    def __init__(self, date, data_cache=None):
         """
         Initializes a new instance of the News class with the specified date.
 
@@ -39,24 +38,25 @@ class News:
         ------------
         date : datetime
             The initial date of the news.
+        data_cache : DataCache
+            The parsed data files, such as the one of the world, so that they are only
+            read once. Defaults to the cache of the 'Data' directory.
         """
         super().__init__()
         self.__date = date
         self.__news = []
-        self.__initialize_news()
+        self.__initialize_news(DataCache() if data_cache is None else data_cache)
 
-    def __initialize_news(self):
+    def __initialize_news(self, data_cache):
         """
-        Initializes the news by reading the CSV file located in the 'Data' directory.
-        """
-        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
-        file = os.path.join(root, "Data", "News.csv")
+        Initializes the news from the cache of the data files.
 
-        with open(file, newline="", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=";")
-            next(reader)
-            for line in reader:
-                self.__news.append(line[0])
+        Parameters:
+        ------------
+        data_cache : DataCache
+            The parsed data files.
+        """
+        self.__news = list(data_cache.get_names("News.csv"))
 
     def add_day(self):
         """
@@ -0,0 +1,79 @@
+import heapq
+import numpy as np
+
+class Outbreaks:
+    """
+    Class scheduling the rare spontaneous outbreaks of the disease in each region.
+
+    Each region has a small probability of a spontaneous outbreak at every check,
+    one check every period days. Rather than drawing a random number for every
+    region at every check, the number of checks until the outbreak of each region
+    is drawn once from the geometric distribution, which gives the same outbreak
+    days, and the outbreaks are kept in a priority queue ordered by day. Work is
+    then only done when an outbreak is due.
+
+    Attributes:
+    -----------
+    __events : list
+        Heap of the scheduled outbreaks, as (day, region index) tuples.
+
+    Methods:
+    --------
+    __init__(regions, probability=0.01, period=4, seed=None):
+        Initializes a new instance of the Outbreaks class and schedules the outbreak of every region.
+    pop_due(ticks):
+        Removes and returns the regions whose outbreak is due.
+    get_next():
+        Returns the day of the next outbreak.
+    """
+
+    __slots__ = ["__events"]
+
+    def __init__(self, regions, probability=0.01, period=4, seed=None):
+        """
+        Initializes a new instance of the Outbreaks class and schedules the outbreak of every region.
+
+        Parameters:
+        ------------
+        regions : int
+            The number of regions.
+        probability : float
+            The probability of an outbreak in a region at each check.
+        period : int
+            The number of days between two checks.
+        seed : int
+            Seed of the random number generator, for reproducible runs.
+        """
+        checks = np.random.default_rng(seed).geometric(probability, size=regions)
+        self.__events = list(zip((checks * period).tolist(), range(regions)))
+        heapq.heapify(self.__events)
+
+    def pop_due(self, ticks):
+        """
+        Removes and returns the regions whose outbreak is due.
+
+        Parameters:
+        ------------
+        ticks : int
+            The number of days simulated.
+
+        Returns:
+        ----------
+        list :
+            The indices of the regions whose outbreak is due on or before that day.
+        """
+        due = []
+        while self.__events and self.__events[0][0] <= ticks:
+            due.append(heapq.heappop(self.__events)[1])
+        return due
+
+    def get_next(self):
+        """
+        Returns the day of the next outbreak.
+
+        Returns:
+        ----------
+        int :
+            The day of the next outbreak, or None if every outbreak already happened.
+        """
+        return self.__events[0][0] if self.__events else None
\ No newline at end of file
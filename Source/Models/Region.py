@@ -26,10 +26,12 @@ class Region:
 
     Methods:
     --------
-    __init__(name):
+    __init__(name, map_path=None):
         Initializes a new instance of the Region class with the specified name.
     __initialize_map():
         Initializes the path to the image file representing the map of the region.
+    set_population(value):
+        Sets the list containing the population information of the region.
     set_healthy_population(value):
         Sets the healthy population of the region.
     set_infected_population(value):
@@ -64,11 +66,15 @@ class Region:
         Returns the temperature of the region.
     get_neighbors():
         Returns the list of neighboring regions.
+    get_key(name):
+        Returns the key under which the name of a region is matched across files.
     """
 
     __slots__ = ["__name", "__map_path", "__population", "__area", "__temperature", "__neighbors"]
 
-    def __init__(self, name):
+    __DIRECTIONS = {"eastern": "east", "northern": "north", "southern": "south", "western": "west"}
+
+    def __init__(self, name, map_path=None):
         """
         Initializes a new instance of the Region class with the specified name.
 
@@ -76,13 +82,19 @@ class Region:
         ------------
         name : str
             The name of the region.
+        map_path : str
+            The path to the image file representing the map of the region. Defaults to
+            the image named after the region in Assets/Maps.
         """
         self.__name = name
         self.__population = [0, 0, 0, 0]
         self.__area = 0
         self.__temperature = 0
         self.__neighbors = []
-        self.__initialize_map()
+        if map_path is None:
+            self.__initialize_map()
+        else:
+            self.__map_path = map_path
 
     def __initialize_map(self):
         """
@@ -92,6 +104,20 @@ class Region:
         file_path = os.path.join(root, "Assets", "Maps", f"{self.__name.lower()}.png")
         self.__map_path = file_path
 
+    def set_population(self, value):
+        """
+        Sets the list containing the population information of the region.
+
+        The value can be a row of a shared NumPy array, in which case the region
+        reads and writes its populations directly in that array.
+
+        Parameters:
+        ------------
+        value : list or numpy.ndarray
+            The new population information, following the indices of __population.
+        """
+        self.__population = value
+
     def set_infected_population(self, value):
         """
         Sets the infected population of the region.
@@ -277,4 +303,28 @@ class Region:
         list :
             The list of neighboring regions.
         """
-        return self.__neighbors
\ No newline at end of file
+        return self.__neighbors
+
+    @staticmethod
+    def get_key(name):
+        """
+        Returns the key under which the name of a region is matched across files.
+
+        The data files and the map images do not always write the names the same
+        way, so names are compared regardless of case, word order and of the
+        "Eastern"/"East" style of directions.
+
+        Parameters:
+        ------------
+        name : str
+            The name of a region, as written in a data file or a map image.
+
+        Returns:
+        ----------
+        str :
+            The lowercase words of the name, with directions in their short form,
+            sorted alphabetically.
+        """
+        words = [Region.__DIRECTIONS.get(word, word) for word in name.lower().split()]
+        words.sort()
+        return " ".join(words)
\ No newline at end of file
@@ -0,0 +1,173 @@
+import numpy as np
+from Source.Models.Engine import Engine
+from Source.Models.Integrators import EulerIntegrator
+
+class Scenarios:
+    """
+    Class to advance many disease configurations on the same world in a single array step.
+
+    The populations of every scenario are stored in one array of shape
+    (scenarios, regions, 4) and the disease levels in one array of shape
+    (scenarios, 6), so large parameter sweeps run in one process without
+    pickling or process startup costs. Each step corresponds to one day of
+    game time, with the spread between neighboring regions every fourth day
+    as in Simulation.
+
+    Attributes:
+    -----------
+    __adjacency : tuple
+        Neighbors of the regions in compressed sparse row form, as compiled by the world.
+    __areas : numpy.ndarray
+        Array containing the area of each region.
+    __coefficients : tuple
+        Recovery and death probabilities of every scenario and region, computed once
+        since the levels of a scenario never change.
+    __integrator : EulerIntegrator or AdaptiveIntegrator
+        Integrator used to advance the populations over a tick.
+    __levels : numpy.ndarray
+        Array of shape (scenarios, 6) containing the disease levels of each scenario,
+        following the indices of the Disease levels.
+    __populations : numpy.ndarray
+        Array of shape (scenarios, regions, 4) containing the populations,
+        following the indices of Region.
+    __random : numpy.random.Generator
+        Random number generator used for the spread between regions.
+    __temperatures : numpy.ndarray
+        Array containing the temperature of each region.
+    __ticks : int
+        Number of steps performed since the start of the scenarios.
+
+    Methods:
+    --------
+    __init__(world, levels, seed=None, integrator=None):
+        Initializes a new instance of the Scenarios class with the specified world and levels.
+    __infect_neighbors():
+        Spreads the infection to neighboring regions in every scenario at once.
+    step(n=1):
+        Advances every scenario by the specified number of days.
+    run(days):
+        Advances every scenario by the specified number of days and records the populations.
+    get_levels():
+        Returns the array containing the disease levels of each scenario.
+    get_populations():
+        Returns the array containing the populations of every scenario.
+    """
+
+    __slots__ = ["__adjacency", "__areas", "__coefficients", "__integrator", "__levels",
+                 "__populations", "__random", "__temperatures", "__ticks"]
+
+    def __init__(self, world, levels, seed=None, integrator=None):
+        """
+        Initializes a new instance of the Scenarios class with the specified world and levels.
+
+        Every scenario starts from the current populations of the world.
+
+        Parameters:
+        ------------
+        world : World
+            The world model.
+        levels : list or numpy.ndarray
+            The disease levels of each scenario, of shape (scenarios, 6).
+        seed : int
+            Seed of the random number generator, for reproducible runs.
+        integrator : EulerIntegrator or AdaptiveIntegrator
+            The integrator used to advance the populations. Defaults to the fixed-step
+            Euler method.
+        """
+        regions = world.get_regions()
+
+        self.__levels = np.array(levels, dtype=float).reshape(-1, 6)
+        self.__areas = np.array([region.get_area() for region in regions], dtype=float)
+        self.__temperatures = np.array([region.get_temperature() for region in regions],
+                                       dtype=float)
+        populations = np.array([[region.get_infected_population(),
+                                 region.get_deceased_population(),
+                                 region.get_recovered_population(),
+                                 region.get_healthy_population()]
+                                for region in regions], dtype=float).reshape(-1, 4)
+        self.__populations = np.repeat(populations[None], len(self.__levels), axis=0)
+
+        self.__adjacency = world.get_adjacency()
+        self.__coefficients = Engine.get_coefficients(self.__levels, self.__temperatures)
+        self.__integrator = EulerIntegrator() if integrator is None else integrator
+        self.__random = np.random.default_rng(seed)
+        self.__ticks = 0
+
+    def __infect_neighbors(self):
+        """
+        Spreads the infection to neighboring regions in every scenario at once.
+
+        In each scenario, every region with at least 10% of its population infected
+        picks a random neighbor, which is infected if it was not already.
+        """
+        indptr, indices = self.__adjacency
+        infected = self.__populations[..., 0]
+        degrees = np.diff(indptr)
+        spreading = infected / self.__populations.sum(axis=-1) >= 0.1
+        spreading &= degrees > 0
+        scenarios, regions = np.nonzero(spreading)
+        if scenarios.size:
+            choices = indptr[regions] + self.__random.integers(0, degrees[regions])
+            neighbors = indices[choices]
+            healthy = infected[scenarios, neighbors] == 0
+            infected[scenarios[healthy], neighbors[healthy]] = 0.01
+
+    def step(self, n=1):
+        """
+        Advances every scenario by the specified number of days.
+
+        Parameters:
+        ------------
+        n : int
+            The number of days to simulate.
+        """
+        for _ in range(n):
+            b = self.__populations[..., 3] / self.__areas * self.__levels[:, 1, None]
+            g, d = self.__coefficients
+            self.__populations = self.__integrator.integrate(self.__populations, b, g, d, 10)
+            self.__ticks += 1
+            if self.__ticks % 4 == 0:
+                self.__infect_neighbors()
+
+    def run(self, days):
+        """
+        Advances every scenario by the specified number of days and records the populations.
+
+        Parameters:
+        ------------
+        days : int
+            The number of days to simulate.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (days, scenarios, regions, 4) containing the populations
+            at the end of each day.
+        """
+        history = np.empty((days,) + self.__populations.shape)
+        for day in range(days):
+            self.step()
+            history[day] = self.__populations
+        return history
+
+    def get_levels(self):
+        """
+        Returns the array containing the disease levels of each scenario.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (scenarios, 6) containing the disease levels.
+        """
+        return self.__levels
+
+    def get_populations(self):
+        """
+        Returns the array containing the populations of every scenario.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (scenarios, regions, 4) containing the populations.
+        """
+        return self.__populations
\ No newline at end of file
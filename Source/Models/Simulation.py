@@ -0,0 +1,234 @@
+import numpy as np
+from Source.Models.Engine import Engine
+from Source.Models.Snapshot import Snapshot
+
+class Simulation:
+    """
+    Class to run the epidemic on the world without any user interface.
+
+    The simulation only advances when step or run is called and never sleeps,
+    so it can run as fast as the machine allows. It owns the simulated time:
+    each step corresponds to one day of game time, and advances the populations
+    and the date together. The disease earns a point every 42 days, the number of
+    days that used to elapse during the 10 seconds of the former points thread.
+
+    The spread between regions seeds a random neighbor of the regions with at
+    least 10% infected every fourth day, or, when a Mobility model is given, moves
+    the infection along its flow matrix every day. When an Outbreaks model is
+    given, uninfected regions are also seeded on the days of their spontaneous
+    outbreaks.
+
+    After each step, an immutable Snapshot of the world is published on the world
+    model, so that the interface reads a consistent state while the next step runs.
+
+    Attributes:
+    -----------
+    __adjacency : tuple
+        Neighbors of the regions in compressed sparse row form, as compiled by the world.
+    __disease_model : Disease
+        Model representing the disease.
+    __engine : Engine
+        Engine advancing the populations of every region at once.
+    __mobility : Mobility
+        Model spreading the infection along a weighted flow matrix, or None to seed
+        random neighbors.
+    __names : tuple
+        Names of the regions, in the order of the rows of the engine.
+    __news_model : News
+        Model for managing news and the date, advanced by one day at each step.
+    __outbreaks : Outbreaks
+        Model scheduling the spontaneous outbreaks in each region, or None without them.
+    __random : numpy.random.Generator
+        Random number generator used for the spread between regions.
+    __ticks : int
+        Number of steps performed since the start of the simulation.
+    __world_model : World
+        Model representing the world and its regions.
+
+    Methods:
+    --------
+    __init__(disease, world, news=None, seed=None, integrator=None, mobility=None, outbreaks=None):
+        Initializes a new instance of the Simulation class with the specified disease and world.
+    __infect_neighbors():
+        Spreads the infection to neighboring regions of every region at once.
+    __start_outbreaks():
+        Seeds the uninfected regions whose spontaneous outbreak is due.
+    __publish():
+        Publishes a snapshot of the current state on the world model.
+    step(n=1):
+        Advances the simulation by the specified number of days.
+    run(days):
+        Advances the simulation by the specified number of days and records the populations.
+    get_disease():
+        Returns the disease model.
+    get_news():
+        Returns the news model.
+    get_ticks():
+        Returns the number of steps performed since the start of the simulation.
+    get_world():
+        Returns the world model.
+    """
+
+    __slots__ = ["__adjacency", "__disease_model", "__engine", "__mobility", "__names",
+                 "__news_model", "__outbreaks", "__random", "__ticks", "__world_model"]
+
+    def __init__(self, disease, world, news=None, seed=None, integrator=None, mobility=None,
+                 outbreaks=None):
+        """
+        Initializes a new instance of the Simulation class with the specified disease and world.
+
+        Parameters:
+        ------------
+        disease : Disease
+            The disease model.
+        world : World
+            The world model.
+        news : News
+            The news model whose date follows the simulation, if any.
+        seed : int
+            Seed of the random number generator, for reproducible runs.
+        integrator : EulerIntegrator or AdaptiveIntegrator
+            The integrator used by the engine. Defaults to the fixed-step Euler method.
+        mobility : Mobility
+            The model spreading the infection along a weighted flow matrix, or None to
+            seed random neighbors.
+        outbreaks : Outbreaks
+            The model scheduling the spontaneous outbreaks in each region, or None
+            without spontaneous outbreaks.
+        """
+        self.__disease_model = disease
+        self.__world_model = world
+        self.__news_model = news
+        self.__engine = Engine(disease, world, integrator)
+        self.__names = tuple(region.get_name() for region in world.get_regions())
+        self.__adjacency = world.get_adjacency()
+        self.__mobility = mobility
+        self.__outbreaks = outbreaks
+        self.__random = np.random.default_rng(seed)
+        self.__ticks = 0
+        self.__publish()
+
+    def __infect_neighbors(self):
+        """
+        Spreads the infection to neighboring regions of every region at once.
+
+        Every region with at least 10% of its population infected picks a random
+        neighbor, which is infected if it was not already.
+        """
+        indptr, indices = self.__adjacency
+        populations = self.__engine.get_populations()
+        infected = populations[:, 0]
+        degrees = np.diff(indptr)
+        spreading = np.flatnonzero((infected / populations.sum(axis=1) >= 0.1) & (degrees > 0))
+        if spreading.size:
+            choices = indptr[spreading] + self.__random.integers(0, degrees[spreading])
+            neighbors = indices[choices]
+            infected[neighbors[infected[neighbors] == 0]] = 0.01
+
+    def __start_outbreaks(self):
+        """
+        Seeds the uninfected regions whose spontaneous outbreak is due.
+        """
+        due = self.__outbreaks.pop_due(self.__ticks)
+        if due:
+            infected = self.__engine.get_populations()[:, 0]
+            regions = np.array(due, dtype=np.intp)
+            infected[regions[infected[regions] == 0]] = 0.01
+
+    def __publish(self):
+        """
+        Publishes a snapshot of the current state on the world model.
+        """
+        date = None if self.__news_model is None else self.__news_model.get_date()
+        snapshot = Snapshot(self.__names, self.__engine.get_populations(), date, self.__ticks)
+        self.__world_model.set_snapshot(snapshot)
+
+    def step(self, n=1):
+        """
+        Advances the simulation by the specified number of days.
+
+        Parameters:
+        ------------
+        n : int
+            The number of days to simulate.
+        """
+        for _ in range(n):
+            self.__engine.step()
+            self.__ticks += 1
+            if self.__mobility is not None:
+                self.__mobility.spread(self.__engine.get_populations())
+            elif self.__ticks % 4 == 0:
+                self.__infect_neighbors()
+            if self.__outbreaks is not None:
+                self.__start_outbreaks()
+            if self.__ticks % 42 == 0:
+                self.__disease_model.accrue_points()
+            if self.__news_model is not None:
+                self.__news_model.add_day()
+            self.__publish()
+
+    def run(self, days):
+        """
+        Advances the simulation by the specified number of days and records the populations.
+
+        Parameters:
+        ------------
+        days : int
+            The number of days to simulate.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (days, regions, 4) containing the populations of every
+            region at the end of each day, following the indices of Region.
+        """
+        populations = self.__engine.get_populations()
+        history = np.empty((days,) + populations.shape)
+        for day in range(days):
+            self.step()
+            history[day] = populations
+        return history
+
+    def get_disease(self):
+        """
+        Returns the disease model.
+
+        Returns:
+        ----------
+        Disease :
+            The disease model.
+        """
+        return self.__disease_model
+
+    def get_news(self):
+        """
+        Returns the news model.
+
+        Returns:
+        ----------
+        News :
+            The news model, or None if the simulation has no date.
+        """
+        return self.__news_model
+
+    def get_ticks(self):
+        """
+        Returns the number of steps performed since the start of the simulation.
+
+        Returns:
+        ----------
+        int :
+            The number of steps performed.
+        """
+        return self.__ticks
+
+    def get_world(self):
+        """
+        Returns the world model.
+
+        Returns:
+        ----------
+        World :
+            The world model.
+        """
+        return self.__world_model
\ No newline at end of file
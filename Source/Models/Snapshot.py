@@ -0,0 +1,138 @@
+import numpy as np
+
+class Snapshot:
+    """
+    Class representing an immutable view of the world after a simulated day.
+
+    The simulation publishes a new snapshot after each step by replacing the
+    previous one, which is a single atomic assignment. Readers on other threads
+    therefore always see populations, date and day count from the same step,
+    without holding any lock.
+
+    Attributes:
+    -----------
+    __date : str
+        Date of the snapshot, formatted by the news model, or None without a date.
+    __names : tuple
+        Names of the regions, in the order of the rows of __populations.
+    __populations : numpy.ndarray
+        Read-only array of shape (regions, 4) containing the populations of each region,
+        following the indices of Region.
+    __ticks : int
+        Number of days simulated when the snapshot was taken.
+
+    Methods:
+    --------
+    __init__(names, populations, date, ticks):
+        Initializes a new instance of the Snapshot class with a copy of the populations.
+    get_colors():
+        Returns the colors representing the state of each region on the map.
+    get_date():
+        Returns the date of the snapshot.
+    get_names():
+        Returns the names of the regions.
+    get_populations():
+        Returns the read-only array containing the populations of each region.
+    get_rates():
+        Returns the rates of each population in each region.
+    get_ticks():
+        Returns the number of days simulated when the snapshot was taken.
+    """
+
+    __slots__ = ["__date", "__names", "__populations", "__ticks"]
+
+    def __init__(self, names, populations, date, ticks):
+        """
+        Initializes a new instance of the Snapshot class with a copy of the populations.
+
+        Parameters:
+        ------------
+        names : tuple
+            The names of the regions.
+        populations : numpy.ndarray
+            The populations of each region, copied so that later steps don't change them.
+        date : str
+            The date of the snapshot, or None without a date.
+        ticks : int
+            The number of days simulated.
+        """
+        self.__date = date
+        self.__names = names
+        self.__populations = populations.copy()
+        self.__populations.flags.writeable = False
+        self.__ticks = ticks
+
+    def get_colors(self):
+        """
+        Returns the colors representing the state of each region on the map.
+
+        The red channel grows with the infected and deceased rates, and the blue
+        channel with the deceased rate.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (regions, 3) containing the RGB color of each region.
+        """
+        rates = self.get_rates()
+        colors = np.zeros((len(rates), 3))
+        colors[:, 0] = rates[:, 0] * 255 + rates[:, 1] * 255
+        colors[:, 2] = rates[:, 1] * 255
+        return colors
+
+    def get_date(self):
+        """
+        Returns the date of the snapshot.
+
+        Returns:
+        ----------
+        str :
+            The date formatted as a string, or None without a date.
+        """
+        return self.__date
+
+    def get_names(self):
+        """
+        Returns the names of the regions.
+
+        Returns:
+        ----------
+        tuple :
+            The names of the regions, in the order of the rows of the populations.
+        """
+        return self.__names
+
+    def get_populations(self):
+        """
+        Returns the read-only array containing the populations of each region.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (regions, 4) containing the infected, deceased, recovered
+            and healthy populations of each region.
+        """
+        return self.__populations
+
+    def get_rates(self):
+        """
+        Returns the rates of each population in each region.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (regions, 4) containing the infected, deceased, recovered
+            and healthy rates of each region.
+        """
+        return self.__populations / self.__populations.sum(axis=1, keepdims=True)
+
+    def get_ticks(self):
+        """
+        Returns the number of days simulated when the snapshot was taken.
+
+        Returns:
+        ----------
+        int :
+            The number of days simulated.
+        """
+        return self.__ticks
\ No newline at end of file
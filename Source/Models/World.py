@@ -1,86 +1,244 @@
-import csv
 import os
+import numpy as np
+from Source.Models.Adjacency import Adjacency
+from Source.Models.DataCache import DataCache
 from Source.Models.Region import Region
 
 class World:
     """
     Class to manage the different regions of the world.
 
+    The data files are read column by column into arrays, from a binary cache
+    rebuilt when they change, and the names of their rows are resolved through an
+    alias index built from Data/Population.csv, which matches names regardless of
+    case, word order and of the "Eastern"/"East" style of directions. All the
+    unknown, duplicate and missing rows of every file are collected in one pass,
+    and reported together if a region lacks required data.
+
     Attributes:
     -----------
+    __adjacency : tuple
+        Neighbors of the regions in compressed sparse row form, as an array of offsets
+        and an array of neighbor indices, following the order of get_regions.
+    __aliases : dict
+        Dictionary giving the name of each region from the key of any of its names.
+    __data_cache : DataCache
+        Parsed data files, shared with the other models reading them.
+    __problems : list
+        Unknown, duplicate and missing rows found while reading the data files.
     __regions : dict
         Dictionary containing the world's regions with their name as the key
         and the corresponding Region object as the value.
+    __snapshot : Snapshot
+        Latest snapshot published by the simulation, or None before the simulation starts.
 
     Methods:
     --------
-    __init__():
+    __init__(data_path=None, maps_path=None, adjacency=False):
         Initializes a new instance of the World class by retrieving region data.
-    __retrieve_regions():
+    __resolve(file_name, names, indices, unique=True):
+        Returns the indices of the regions designated by the names of a data file.
+    __retrieve_regions(maps_path):
         Retrieves region data from CSV files.
+    __detect_neighbors(links_path):
+        Replaces the neighbors of the regions with the ones found on their map images.
+    __compile_adjacency():
+        Compiles the neighbors of the regions into compressed sparse row form.
     initialize_infected_population(region_name):
         Initializes the infected population for a specific region.
+    set_snapshot(snapshot):
+        Replaces the latest snapshot of the world.
+    get_adjacency():
+        Returns the neighbors of the regions in compressed sparse row form.
+    get_data_cache():
+        Returns the parsed data files.
+    get_problems():
+        Returns the unknown, duplicate and missing rows found in the data files.
     get_regions():
         Returns the list of Region objects representing the world's regions.
+    get_snapshot():
+        Returns the latest snapshot of the world.
     """
 
-    __slots__ = ["__regions"]
+    __slots__ = ["__adjacency", "__aliases", "__data_cache", "__problems", "__regions",
+                 "__snapshot"]
 
-    def __init__(self):
+    def __init__(self, data_path=None, maps_path=None, adjacency=False):
         """
         Initializes a new instance of the World class by retrieving region data.
+
+        Parameters:
+        ------------
+        data_path : str
+            The directory containing the data files. Defaults to Data.
+        maps_path : str
+            The directory containing the map images. Defaults to Assets/Maps.
+        adjacency : bool
+            If True, the neighbors of the regions are the ones touching on their map
+            images, plus the links of Data/Neighborhood.csv, instead of these links only.
+
+        Raises:
+        ----------
+        ValueError :
+            If a region has no area or no temperature, with every problem found.
         """
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        if data_path is None:
+            data_path = os.path.join(root, "Data")
+        self.__aliases = {}
+        self.__data_cache = DataCache(data_path)
+        self.__problems = []
         self.__regions = {}
-        self.__retrieve_regions()
+        self.__snapshot = None
+        self.__retrieve_regions(os.path.join(root, "Assets", "Maps") if maps_path is None
+                                else maps_path)
+        if adjacency:
+            self.__detect_neighbors(os.path.join(data_path, "Neighborhood.csv"))
+        self.__compile_adjacency()
+
+    def __resolve(self, file_name, names, indices, unique=True):
+        """
+        Returns the indices of the regions designated by the names of a data file.
+
+        Unknown names, and duplicate names if they must be unique, are added to the
+        problems. The names found are added to the index as they are, so that names
+        repeated across files are only normalized once.
+
+        Parameters:
+        ------------
+        file_name : str
+            The name of the data file, used in the problems.
+        names : list
+            The names of the rows of the file.
+        indices : dict
+            Dictionary giving the index of each region from the key of its name or
+            from a name already found.
+        unique : bool
+            Indicates if each region must appear at most once among the names.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            The index of the region of each row, or -1 for unknown names.
+        """
+        rows = [indices.get(name, -1) for name in names]
+        for row in [row for row, index in enumerate(rows) if index < 0]:
+            rows[row] = indices.get(Region.get_key(names[row]), -1)
+            if rows[row] >= 0:
+                indices[names[row]] = rows[row]
+        rows = np.array(rows, dtype=np.intp)
+        for row in np.flatnonzero(rows < 0):
+            self.__problems.append(f"{file_name}: unknown region '{names[row]}'")
+        if not unique:
+            return rows
+        counts = np.bincount(rows[rows >= 0], minlength=rows.max(initial=0) + 1)
+        for row in np.flatnonzero((rows >= 0) & (counts[np.maximum(rows, 0)] > 1)):
+            self.__problems.append(f"{file_name}: duplicate row for region '{names[row]}'")
+        return rows
 
-    def __retrieve_regions(self):
+    def __retrieve_regions(self, maps_path):
         """
         Retrieves region data from CSV files.
+
+        Parameters:
+        ------------
+        maps_path : str
+            The directory containing the map images.
         """
-        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        cache = self.__data_cache
+        names = cache.get_names("Population.csv")
+        populations = cache.get_values("Population.csv")
+        indices = {}
+        name_keys = [Region.get_key(name) for name in names]
+        for index, key in enumerate(name_keys):
+            indices.setdefault(key, index)
+        keys = list(indices)
+        for name, key in zip(names, name_keys):
+            indices.setdefault(name, indices[key])
+        world = indices.get(Region.get_key("World"), -1)
+        # Rows of the regions, without the duplicate rows and the row of the whole world
+        rows = sorted(indices[key] for key in keys if indices[key] != world)
+        self.__aliases = {key: names[indices[key]] for key in keys if indices[key] != world}
+        self.__resolve("Population.csv", names, indices)
+
+        columns = []
+        for file_name in ["Area.csv", "Temperature.csv"]:
+            resolved = self.__resolve(file_name, cache.get_names(file_name), indices)
+            column = np.full(len(names), np.nan)
+            column[resolved[resolved >= 0]] = cache.get_values(file_name)[resolved >= 0]
+            for index in np.flatnonzero(np.isnan(column[rows])):
+                self.__problems.append(f"{file_name}: no row for region '{names[rows[index]]}'")
+            columns.append(column)
+        areas, temperatures = columns
+
+        resolved = self.__resolve("Neighborhood.csv", cache.get_names("Neighborhood.csv"), indices)
+        neighbor_names = [value.split(",")
+                          for value in cache.get_values("Neighborhood.csv").tolist()]
+        neighbors = self.__resolve("Neighborhood.csv",
+                                   [name for row in neighbor_names for name in row], indices,
+                                   unique=False)
+        offsets = np.cumsum([0] + [len(row) for row in neighbor_names])
+
+        map_paths = [None] * len(names)
+        files = sorted(file for file in os.listdir(maps_path) if file.endswith(".png"))
+        for file, index in zip(files, self.__resolve(os.path.basename(maps_path),
+                                                     [file[:-4] for file in files], indices)):
+            if index >= 0:
+                map_paths[index] = os.path.join(maps_path, file)
+        for index in rows:
+            if map_paths[index] is None:
+                self.__problems.append(f"{os.path.basename(maps_path)}: no map image for region "
+                                       f"'{names[index]}'")
+                map_paths[index] = os.path.join(maps_path, f"{names[index].lower()}.png")
+
+        if np.isnan(areas[rows]).any() or np.isnan(temperatures[rows]).any():
+            raise ValueError("Invalid world data:\n" + "\n".join(self.__problems))
+
+        regions = {index: Region(names[index], map_paths[index]) for index in rows}
+        for index, region in regions.items():
+            region.set_healthy_population(float(populations[index]))
+            region.set_area(float(areas[index]))
+            region.set_temperature(float(temperatures[index]))
+        for row, index in enumerate(resolved.tolist()):
+            if index in regions:
+                row_neighbors = neighbors[offsets[row]:offsets[row + 1]].tolist()
+                regions[index].set_neighbors([regions[neighbor] for neighbor in row_neighbors
+                                              if neighbor in regions])
+
+        self.__regions = {names[index]: region for index, region in regions.items()}
+
+    def __detect_neighbors(self, links_path):
+        """
+        Replaces the neighbors of the regions with the ones found on their map images.
+
+        The adjacency is cached in adjacency.npz next to the map images, and only
+        computed again when they or the links file change.
+
+        Parameters:
+        ------------
+        links_path : str
+            The path to the file listing the links that cannot be seen on the map.
+        """
+        regions = self.get_regions()
+        matrix = Adjacency([region.get_map_path() for region in regions], links_path).get_matrix()
+        for region, row in zip(regions, matrix):
+            region.set_neighbors([regions[neighbor] for neighbor in np.flatnonzero(row)])
 
-        file_path = os.path.join(root, "Data", "Population.csv")
-        with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=",")
-            next(reader)
-            for row in reader:
-                name = row[0]
-                population = row[1].replace("\u202f", "")
-                region = Region(name)
-                region.set_healthy_population(float(population))
-                self.__regions[name] = region
-
-        file_path = os.path.join(root, "Data", "Area.csv")
-        with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=",")
-            next(reader)
-            for row in reader:
-                name = row[0]
-                area = row[1]
-                region = self.__regions[name]
-                region.set_area(float(area))
-
-        file_path = os.path.join(root, "Data", "Temperature.csv")
-        with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=",")
-            next(reader)
-            for row in reader:
-                name = row[0]
-                temperature = row[1]
-                region = self.__regions[name]
-                region.set_temperature(float(temperature))
-
-        file_path = os.path.join(root, "Data", "Neighborhood.csv")
-        with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=":")
-            next(reader)
-            for row in reader:
-                name = row[0]
-                neighbors = [self.__regions[neighbor_name] for neighbor_name in row[1].split(",")]
-                region = self.__regions[name]
-                region.set_neighbors(neighbors)
-
-        del self.__regions["World"]
+    def __compile_adjacency(self):
+        """
+        Compiles the neighbors of the regions into compressed sparse row form.
+
+        The neighbors of the region at index i are indices[indptr[i]:indptr[i + 1]],
+        so the spread between regions can be computed for all of them at once.
+        """
+        regions = self.get_regions()
+        positions = {id(region): index for index, region in enumerate(regions)}
+        degrees = [len(region.get_neighbors()) for region in regions]
+        indptr = np.zeros(len(regions) + 1, dtype=np.intp)
+        np.cumsum(degrees, out=indptr[1:])
+        indices = np.array([positions[id(neighbor)] for region in regions
+                            for neighbor in region.get_neighbors()], dtype=np.intp)
+        self.__adjacency = (indptr, indices)
 
     def initialize_infected_population(self, region_name):
         """
@@ -89,9 +247,54 @@ class World:
         Parameters:
         ------------
         region_name : str
-            The name of the region to initialize.
+            The name of the region to initialize, resolved through the alias index.
+        """
+        self.__regions[self.__aliases[Region.get_key(region_name)]].set_infected_population(0.01)
+
+    def set_snapshot(self, snapshot):
+        """
+        Replaces the latest snapshot of the world.
+
+        Parameters:
+        ------------
+        snapshot : Snapshot
+            The new snapshot, which readers see as a whole once assigned.
+        """
+        self.__snapshot = snapshot
+
+    def get_adjacency(self):
+        """
+        Returns the neighbors of the regions in compressed sparse row form.
+
+        Returns:
+        ----------
+        tuple :
+            The array of offsets, of length regions + 1, and the array of neighbor
+            indices, both following the order of get_regions.
+        """
+        return self.__adjacency
+
+    def get_data_cache(self):
         """
-        self.__regions[region_name].set_infected_population(0.01)
+        Returns the parsed data files.
+
+        Returns:
+        ----------
+        DataCache :
+            The data files read when the world was created, such as Data/News.csv.
+        """
+        return self.__data_cache
+
+    def get_problems(self):
+        """
+        Returns the unknown, duplicate and missing rows found in the data files.
+
+        Returns:
+        ----------
+        list :
+            A description of each problem, prefixed with the name of its file.
+        """
+        return self.__problems
 
     def get_regions(self):
         """
@@ -102,4 +305,15 @@ class World:
         list :
             List of Region objects.
         """
-        return list(self.__regions.values())
\ No newline at end of file
+        return list(self.__regions.values())
+
+    def get_snapshot(self):
+        """
+        Returns the latest snapshot of the world.
+
+        Returns:
+        ----------
+        Snapshot :
+            The latest snapshot, or None before the simulation starts.
+        """
+        return self.__snapshot
\ No newline at end of file
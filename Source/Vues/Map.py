@@ -1,28 +1,35 @@
 import tkinter as tk
-import numpy as np
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from Source.Global import Global
 from Source.Controllers.MapController import MapController
 from Source.Views.Improvements import Improvements
 from Source.Views.Information import Information
+from Source.Views.MapRenderer import MapRenderer
+from Source.Views.RenderWorker import RenderWorker
 
 class Map(tk.Tk):
     """
     Class representing the main game window.
 
-    Inherits from tk.Tk and uses the PIL and NumPy libraries to manage
-    the display of maps and game information.
+    Inherits from tk.Tk and uses a MapRenderer to manage the display of maps
+    and game information.
 
     Attributes:
     -----------
     controller : MapController
         Instance of MapController to manage interactions and data.
-    map_paths : list
-        List of paths to world map images.
-    image : PIL.Image.Image
-        Combined image of the world maps.
+    renderer : MapRenderer
+        Renderer of the world map, holding the decoded map images.
+    worker : RenderWorker
+        Worker building the frames of the world map on a background thread.
     photo : PIL.ImageTk.PhotoImage
-        Image displayed in the canvas of the window.
+        Image displayed in the canvas of the window, updated in place at each frame.
+    map_item : int
+        Identifier of the single canvas item displaying the photo.
+    tooltip_items : tuple
+        Identifiers of the canvas background and text items of the region tooltip.
+    speed_buttons : dict
+        Buttons selecting the time scale, with the time scale as the key.
 
     Methods:
     --------
@@ -34,10 +41,20 @@ class Map(tk.Tk):
         Creates the button to open the information window.
     create_quit_button():
         Creates the button to quit the game.
+    create_speed_buttons():
+        Creates the buttons to select the time scale of the game.
     create_canvas():
         Creates the canvas to display the game maps.
     create_maps():
-        Creates and displays the game maps.
+        Displays the newest update of the game maps.
+    draw_maps(size, parts):
+        Copies the redrawn parts of the game maps into the canvas.
+    resize_maps(event):
+        Resizes the game maps to the new size of the canvas.
+    inspect_region(event):
+        Shows the statistics of the region under the pointer in a tooltip.
+    hide_tooltip(event):
+        Hides the tooltip of the regions.
     create_date():
         Creates the date display in the window.
     create_info_labels():
@@ -50,6 +67,8 @@ class Map(tk.Tk):
         Updates the date display in the window.
     scroll_ticker():
         Scrolls the news in the ticker at the top of the window.
+    set_speed(value):
+        Sets the time scale of the game and highlights the selected button.
     child_window_close():
         Reactivates the parent window when the child window is closed.
     update_rates():
@@ -77,14 +96,15 @@ class Map(tk.Tk):
         """
         super().__init__()
         self.controller = MapController(disease, world)
-        self.map_paths = self.controller.get_map_paths()
-        self.image = None
+        self.renderer = MapRenderer(self.controller.get_map_paths())
+        self.worker = RenderWorker(self.renderer, self.controller.get_colors)
         self.photo = None
         self.attributes('-alpha', 0.0)
         self.setup()
         self.create_improvements_button()
         self.create_information_button()
         self.create_quit_button()
+        self.create_speed_buttons()
         self.create_canvas()
         self.create_date()
         self.create_info_labels()
@@ -120,6 +140,21 @@ class Map(tk.Tk):
             borderwidth=0, highlightthickness=0, pady=10, command=self.quit_game)
         self.quit_button.grid(column=0, row=0, sticky=tk.NSEW)
 
+    def create_speed_buttons(self):
+        """
+        Creates the buttons to select the time scale of the game.
+        """
+        speed_frame = tk.Frame(self, background="black")
+        speed_frame.grid(column=0, row=3, columnspan=7, sticky=tk.NSEW)
+        self.speed_buttons = {}
+        for value, text in [(1, "1×"), (4, "4×"), (16, "16×"), (None, "Max")]:
+            button = tk.Button(
+                speed_frame, text=text, font=("Courier", 18, "bold"), borderwidth=0,
+                highlightthickness=0, pady=10, command=lambda value=value: self.set_speed(value))
+            button.pack(side=tk.LEFT, expand=True, fill=tk.X)
+            self.speed_buttons[value] = button
+        self.set_speed(1)
+
     def create_canvas(self):
         """
         Creates the canvas to display the game maps.
@@ -128,33 +163,106 @@ class Map(tk.Tk):
         tk.Grid.columnconfigure(self, 3, weight=1)
         self.canvas = tk.Canvas(self, background="black", highlightthickness=0)
         self.canvas.grid(column=0, row=1, columnspan=7, sticky=tk.NSEW)
+        self.canvas.bind("<Configure>", self.resize_maps)
+        self.map_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self.tooltip_items = (
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="black", outline="red2",
+                                         state=tk.HIDDEN),
+            self.canvas.create_text(0, 0, fill="white", font=("Courier", 14), anchor=tk.NW,
+                                    justify=tk.LEFT, state=tk.HIDDEN))
+        self.canvas.bind("<Motion>", self.inspect_region)
+        self.canvas.bind("<Button-1>", self.inspect_region)
+        self.canvas.bind("<Leave>", self.hide_tooltip)
 
     def create_maps(self):
         """
-        Creates and displays the game maps.
+        Displays the newest update of the game maps.
+
+        The frames are built by the render worker, so this only picks up the
+        newest finished update, if any.
+        """
+        frame = self.worker.get_frame()
+        if frame is not None:
+            self.draw_maps(*frame)
+        self.after(40, self.create_maps)
+
+    def draw_maps(self, size, parts):
+        """
+        Copies the redrawn parts of the game maps into the canvas.
+
+        The parts are copied into the existing photo, and a new photo is only created
+        when the size of the canvas changes, so the canvas keeps a single image item.
+
+        Parameters:
+        ------------
+        size : tuple
+            The width and height of the frame.
+        parts : list
+            The ((left, upper), PIL.Image.Image) tuples giving the redrawn parts of
+            the frame and their position.
+        """
+        if self.photo is None or (self.photo.width(), self.photo.height()) != size:
+            self.photo = ImageTk.PhotoImage("RGBA", size)
+            self.canvas.itemconfigure(self.map_item, image=self.photo)
+        for (left, upper), image in parts:
+            if image.size == size:
+                self.photo.paste(image)
+            else:
+                part = ImageTk.PhotoImage(image)
+                self.tk.call(str(self.photo), "copy", str(part), "-to", left, upper,
+                             "-compositingrule", "set")
+
+    def resize_maps(self, event):
+        """
+        Resizes the game maps to the new size of the canvas.
+
+        The render worker builds a frame at the new size, which create_maps then
+        displays.
+
+        Parameters:
+        ------------
+        event : tk.Event
+            The configure event of the canvas, holding its new size.
+        """
+        self.worker.set_size((event.width, event.height))
+
+    def inspect_region(self, event):
         """
-        if self.winfo_viewable():
-            width = self.winfo_width()
-            height = self.winfo_height()
-            colors = self.controller.get_colors()
-            self.image = None
+        Shows the statistics of the region under the pointer in a tooltip.
 
-            for i, path in enumerate(self.map_paths):
-                image = Image.open(path).convert("RGBA")
-                if i != 0:
-                    array = np.array(image)
-                    array[..., 0:3] = colors[i - 1]
-                    array[..., 3] = 0.5 * 255 * (array[..., 3] != 0)
-                    image = Image.fromarray(array)
-                if self.image is None:
-                    self.image = image
-                else:
-                    self.image.paste(image, (0, 0), image)
+        The region is found with a single lookup in the label image of the renderer,
+        which has the size of the canvas.
 
-            self.photo = ImageTk.PhotoImage(self.image.resize((width, height)))
-            self.canvas.create_image(0, 0, image=self.photo, anchor=tk.NW)
+        Parameters:
+        ------------
+        event : tk.Event
+            The pointer event, holding the position of the pointer in the canvas.
+        """
+        index = self.renderer.get_region(event.x, event.y)
+        if index is None:
+            self.hide_tooltip(event)
+            return
+        background, text = self.tooltip_items
+        self.canvas.itemconfigure(text, text=self.controller.get_region_stats(index),
+                                  state=tk.NORMAL)
+        self.canvas.coords(text, event.x + 16, event.y + 16)
+        left, upper, right, lower = self.canvas.bbox(text)
+        self.canvas.coords(background, left - 6, upper - 6, right + 6, lower + 6)
+        self.canvas.itemconfigure(background, state=tk.NORMAL)
+        self.canvas.tag_raise(background)
+        self.canvas.tag_raise(text)
 
-        self.after(10000, self.create_maps)
+    def hide_tooltip(self, event):
+        """
+        Hides the tooltip of the regions.
+
+        Parameters:
+        ------------
+        event : tk.Event
+            The event hiding the tooltip.
+        """
+        for item in self.tooltip_items:
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
 
     def create_date(self):
         """
@@ -224,6 +332,19 @@ class Map(tk.Tk):
         self.ticker_label.configure(text=text)
         self.after(120, self.scroll_ticker)
 
+    def set_speed(self, value):
+        """
+        Sets the time scale of the game and highlights the selected button.
+
+        Parameters:
+        ------------
+        value : int
+            The number of simulated days per 240 ms, or None for the maximum speed.
+        """
+        self.controller.set_speed(value)
+        for speed, button in self.speed_buttons.items():
+            button.configure(foreground="red2" if speed == value else "black")
+
     def child_window_close(self):
         """
         Reactivates the parent window when the child window is closed.
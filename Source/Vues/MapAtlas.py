@@ -0,0 +1,129 @@
+import os
+import numpy as np
+from PIL import Image
+from Source.Models.CacheFile import CacheFile
+
+class MapAtlas:
+    """
+    Class packing the map images into a single file read at startup.
+
+    The atlas holds the world map as a palette and an image of indices into it,
+    and the regions as a single label image, all stored in one compressed .npz
+    file. It is built from the map images the first time, then read with a single
+    file read, and rebuilt when the names, sizes or modification times of the map
+    images change.
+
+    Attributes:
+    -----------
+    __background : numpy.ndarray
+        Image giving, for each pixel, the index of its color in __palette.
+    __labels : numpy.ndarray
+        Label image giving, for each pixel, 0 outside the regions or the index of
+        the owning region plus one.
+    __palette : numpy.ndarray
+        Array of shape (background colors, 4) containing the distinct RGBA colors
+        of the world map.
+
+    Methods:
+    --------
+    __init__(map_paths, atlas_path=None):
+        Initializes the atlas from its file if it is up to date, otherwise from the map images.
+    __build(map_paths):
+        Decodes the map images into the arrays of the atlas.
+    get_background():
+        Returns the image of indices into the palette of the world map.
+    get_labels():
+        Returns the label image of the regions.
+    get_palette():
+        Returns the palette of the world map.
+    """
+
+    __slots__ = ["__background", "__labels", "__palette"]
+
+    def __init__(self, map_paths, atlas_path=None):
+        """
+        Initializes the atlas from its file if it is up to date, otherwise from the map images.
+
+        Parameters:
+        ------------
+        map_paths : list
+            Paths to the world map image followed by the region images.
+        atlas_path : str
+            Path to the atlas file. Defaults to atlas.npz next to the world map image.
+        """
+        if atlas_path is None:
+            atlas_path = os.path.join(os.path.dirname(map_paths[0]), "atlas.npz")
+        atlas_file = CacheFile(atlas_path)
+        key = CacheFile.get_key(map_paths)
+
+        atlas = atlas_file.load()
+        if atlas is not None and str(atlas.get("key")) == key:
+            self.__background = atlas["background"]
+            self.__labels = atlas["labels"]
+            self.__palette = atlas["palette"]
+            return
+
+        self.__build(map_paths)
+        atlas_file.save({"key": key, "background": self.__background, "labels": self.__labels,
+                         "palette": self.__palette}, compressed=True)
+
+    def __build(self, map_paths):
+        """
+        Decodes the map images into the arrays of the atlas.
+
+        Where regions overlap, the pixel belongs to the last region, which used to
+        be drawn on top.
+
+        Parameters:
+        ------------
+        map_paths : list
+            Paths to the world map image followed by the region images.
+        """
+        with Image.open(map_paths[0]) as image:
+            background = np.ascontiguousarray(image.convert("RGBA"))
+        packed, inverse = np.unique(background.view(np.uint32), return_inverse=True)
+
+        labels = np.zeros(background.shape[:2], dtype=np.min_scalar_type(len(map_paths) - 1))
+        for index, path in enumerate(map_paths[1:]):
+            with Image.open(path) as image:
+                alpha = np.asarray(image.convert("RGBA"))[..., 3]
+            labels[alpha != 0] = index + 1
+
+        self.__background = inverse.reshape(labels.shape).astype(np.min_scalar_type(len(packed) - 1))
+        self.__labels = labels
+        self.__palette = packed.view(np.uint8).reshape(-1, 4)
+
+    def get_background(self):
+        """
+        Returns the image of indices into the palette of the world map.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Image giving, for each pixel, the index of its color in the palette.
+        """
+        return self.__background
+
+    def get_labels(self):
+        """
+        Returns the label image of the regions.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Label image giving, for each pixel, 0 outside the regions or the index
+            of the owning region plus one.
+        """
+        return self.__labels
+
+    def get_palette(self):
+        """
+        Returns the palette of the world map.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (background colors, 4) containing the distinct RGBA colors
+            of the world map.
+        """
+        return self.__palette
\ No newline at end of file
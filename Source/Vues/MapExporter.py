@@ -0,0 +1,172 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from Source.Views.MapRenderer import MapRenderer
+
+
+def _save_frame(arguments):
+    """
+    Encodes a frame as a PNG file in a worker process.
+
+    Parameters:
+    ------------
+    arguments : tuple
+        The frame as a PIL image and the path of the file to write.
+
+    Returns:
+    ----------
+    str :
+        The path of the written file.
+    """
+    frame, path = arguments
+    frame.save(path, "PNG")
+    return path
+
+
+def _quantize_frame(frame):
+    """
+    Converts a frame to an adaptive palette for a GIF in a worker process.
+
+    Parameters:
+    ------------
+    frame : PIL.Image.Image
+        The frame to convert.
+
+    Returns:
+    ----------
+    PIL.Image.Image :
+        The frame with at most 256 colors.
+    """
+    return frame.convert("RGB").quantize(256)
+
+
+class MapExporter:
+    """
+    Class to render the world map of a simulation without any window and write it to disk.
+
+    A frame is rendered for each simulated day with the same renderer as the game
+    window, so it can run on servers without a display. The frames are encoded on
+    a process pool while the simulation goes on, with a bounded number of frames
+    in flight to keep the memory in check.
+
+    Attributes:
+    -----------
+    __renderer : MapRenderer
+        Renderer of the world map.
+    __workers : int
+        Number of worker processes encoding the frames.
+
+    Methods:
+    --------
+    __init__(world, size=None, workers=None, map_path=None):
+        Initializes a new instance of the MapExporter class for the specified world.
+    __encode(simulation, days, function, arguments):
+        Advances the simulation and encodes the frame of each day on the process pool.
+    export_frames(simulation, days, directory):
+        Advances the simulation and writes the map of each day as a PNG file.
+    export_gif(simulation, days, path, duration=240):
+        Advances the simulation and writes the map of each day to an animated GIF.
+    """
+
+    __slots__ = ["__renderer", "__workers"]
+
+    def __init__(self, world, size=None, workers=None, map_path=None):
+        """
+        Initializes a new instance of the MapExporter class for the specified world.
+
+        Parameters:
+        ------------
+        world : World
+            The world model, whose regions give the map images.
+        size : tuple
+            The width and height of the frames. Defaults to the size of the map images.
+        workers : int
+            The number of worker processes. Defaults to the number of cores.
+        map_path : str
+            The path to the world map image. Defaults to world.png in the directory
+            of the map images of the regions.
+        """
+        region_paths = [region.get_map_path() for region in world.get_regions()]
+        if map_path is None:
+            map_path = os.path.join(os.path.dirname(region_paths[0]), "world.png")
+        self.__renderer = MapRenderer([map_path] + region_paths)
+        if size is not None:
+            self.__renderer.set_size(size)
+        self.__workers = os.cpu_count() if workers is None else workers
+
+    def __encode(self, simulation, days, function, arguments):
+        """
+        Advances the simulation and encodes the frame of each day on the process pool.
+
+        Parameters:
+        ------------
+        simulation : Simulation
+            The simulation to advance.
+        days : int
+            The number of days to simulate.
+        function : function
+            The function encoding a frame in a worker process.
+        arguments : function
+            The function returning the arguments of the encoding function from the
+            frame and the number of days simulated.
+
+        Returns:
+        ----------
+        list :
+            The results of the encoding function, in the order of the days.
+        """
+        world = simulation.get_world()
+        results = []
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            for _ in range(days):
+                simulation.step()
+                snapshot = world.get_snapshot()
+                frame = self.__renderer.render(snapshot.get_colors())
+                pending.append(executor.submit(function, arguments(frame, snapshot.get_ticks())))
+                if len(pending) >= 2 * self.__workers:
+                    results.append(pending.popleft().result())
+            results.extend(future.result() for future in pending)
+        return results
+
+    def export_frames(self, simulation, days, directory):
+        """
+        Advances the simulation and writes the map of each day as a PNG file.
+
+        Parameters:
+        ------------
+        simulation : Simulation
+            The simulation to advance.
+        days : int
+            The number of days to simulate.
+        directory : str
+            The directory in which the frames are written, named after the day.
+
+        Returns:
+        ----------
+        list :
+            The paths of the written files, in the order of the days.
+        """
+        os.makedirs(directory, exist_ok=True)
+        return self.__encode(
+            simulation, days, _save_frame,
+            lambda frame, ticks: (frame, os.path.join(directory, f"day_{ticks:05d}.png")))
+
+    def export_gif(self, simulation, days, path, duration=240):
+        """
+        Advances the simulation and writes the map of each day to an animated GIF.
+
+        Parameters:
+        ------------
+        simulation : Simulation
+            The simulation to advance.
+        days : int
+            The number of days to simulate, which must be positive.
+        path : str
+            The path of the GIF file to write.
+        duration : int
+            The display duration of each day in milliseconds.
+        """
+        frames = self.__encode(simulation, days, _quantize_frame, lambda frame, ticks: frame)
+        frames[0].save(path, "GIF", save_all=True, append_images=frames[1:],
+                       duration=duration, loop=0)
\ No newline at end of file
@@ -0,0 +1,256 @@
+import numpy as np
+from PIL import Image
+from Source.Views.MapAtlas import MapAtlas
+
+class MapRenderer:
+    """
+    Class to render the world map with each region colored according to its state.
+
+    The map images are read once, when the renderer is created, from the atlas
+    packing them into a label image storing for each pixel the index of the region
+    that owns it. Each frame is then built with a single lookup table gather: the
+    table holds, for every region and every background color, the color obtained
+    by drawing the region color at half opacity over the background color. The
+    cost of a frame therefore does not grow with the number of regions.
+
+    The frames are rendered directly at the size of the display. The pixel to table
+    mapping is resampled only when that size changes, so steady frames never
+    resample a full image.
+
+    For the display, the renderer also keeps the last frame and only redraws the
+    bounding boxes of the regions whose color changed by more than a perceptual
+    threshold since they were last drawn.
+
+    Attributes:
+    -----------
+    __boxes : numpy.ndarray
+        Array of shape (regions, 4) containing the bounding box of each region at the
+        display size, as (left, upper, right, lower).
+    __frame : numpy.ndarray
+        Last frame drawn by update, or None if the next update redraws everything.
+    __indices : numpy.ndarray
+        Array giving, for each pixel at the display size, its row in the lookup table.
+    __indices_full : numpy.ndarray
+        Array giving, for each pixel at the resolution of the map images, its row in
+        the lookup table.
+    __labels : numpy.ndarray
+        Label image giving, for each pixel, 0 outside the regions or the index of
+        the owning region plus one.
+    __palette : numpy.ndarray
+        Array of shape (background colors, 4) containing the distinct RGBA colors
+        of the world map.
+    __regions : numpy.ndarray
+        Label image at the display size, used to find the region under a point.
+    __shown : numpy.ndarray
+        Array of shape (regions, 3) containing the colors of the regions in __frame.
+    __size : tuple
+        Width and height of the rendered frames.
+    __threshold : float
+        Largest change of a color channel that is not redrawn by update.
+
+    Methods:
+    --------
+    __init__(map_paths, threshold=2.0):
+        Initializes the renderer from the atlas of the map images.
+    __get_table(colors):
+        Returns the lookup table for the specified region colors.
+    render(colors):
+        Returns the world map with each region filled with its color.
+    update(colors):
+        Redraws the regions whose color changed and returns the redrawn parts.
+    set_size(size):
+        Sets the size of the rendered frames.
+    get_labels():
+        Returns the label image of the regions.
+    get_region(x, y):
+        Returns the index of the region displayed at the specified point.
+    get_size():
+        Returns the size of the rendered frames.
+    """
+
+    __slots__ = ["__boxes", "__frame", "__indices", "__indices_full", "__labels", "__palette",
+                 "__regions", "__shown", "__size", "__threshold"]
+
+    def __init__(self, map_paths, threshold=2.0):
+        """
+        Initializes the renderer from the atlas of the map images.
+
+        Where regions overlap, the pixel belongs to the last region, which used to
+        be drawn on top.
+
+        Parameters:
+        ------------
+        map_paths : list
+            Paths to the world map image followed by the region images.
+        threshold : float
+            Largest change of a color channel, out of 255, that is not redrawn by update.
+        """
+        atlas = MapAtlas(map_paths)
+        labels = atlas.get_labels()
+        palette = atlas.get_palette()
+
+        self.__labels = labels
+        self.__palette = palette.astype(np.uint32)
+        self.__indices_full = labels.astype(np.intp) * len(palette) + atlas.get_background()
+        self.__boxes = np.zeros((len(map_paths) - 1, 4), dtype=np.intp)
+        self.__shown = None
+        self.__threshold = threshold
+        self.__size = None
+        self.set_size((labels.shape[1], labels.shape[0]))
+
+    def __get_table(self, colors):
+        """
+        Returns the lookup table for the specified region colors.
+
+        Parameters:
+        ------------
+        colors : numpy.ndarray
+            Array of shape (regions, 3) containing the RGB color of each region.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array of shape (rows, 4) giving the RGBA color of each row of the table.
+        """
+        fills = np.full((len(colors), 4), 127, dtype=np.uint32)
+        fills[:, 0:3] = colors.astype(np.uint32)
+
+        # Same rounding as the blending of PIL.Image.paste with a mask of 127
+        blend = fills[:, None, :] * 127 + self.__palette[None, :, :] * 128 + 128
+        table = np.empty((len(colors) + 1, len(self.__palette), 4), dtype=np.uint8)
+        table[0] = self.__palette
+        table[1:] = (blend + (blend >> 8)) >> 8
+        return table.reshape(-1, 4)
+
+    def render(self, colors):
+        """
+        Returns the world map with each region filled with its color.
+
+        Parameters:
+        ------------
+        colors : list
+            The RGB color of each region, in the order of the region images.
+
+        Returns:
+        ----------
+        PIL.Image.Image :
+            The rendered world map, at the size set with set_size.
+        """
+        table = self.__get_table(np.asarray(colors, dtype=float).reshape(-1, 3))
+        return Image.fromarray(table[self.__indices], "RGBA")
+
+    def update(self, colors):
+        """
+        Redraws the regions whose color changed and returns the redrawn parts.
+
+        Only the bounding boxes of the regions whose color changed by more than the
+        threshold on any channel are redrawn. The whole frame is redrawn on the
+        first update and after each change of size.
+
+        Parameters:
+        ------------
+        colors : list
+            The RGB color of each region, in the order of the region images.
+
+        Returns:
+        ----------
+        list :
+            A list of ((left, upper), PIL.Image.Image) tuples giving each redrawn part
+            of the frame and its position, empty if nothing changed.
+        """
+        colors = np.asarray(colors, dtype=float).reshape(-1, 3)
+        if self.__frame is None:
+            self.__shown = colors.copy()
+            self.__frame = self.__get_table(self.__shown)[self.__indices]
+            return [((0, 0), Image.fromarray(self.__frame.copy(), "RGBA"))]
+
+        changed = np.abs(colors - self.__shown).max(axis=1) > self.__threshold
+        boxes = self.__boxes[changed]
+        boxes = boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+        self.__shown[changed] = colors[changed]
+        if not len(boxes):
+            return []
+
+        table = self.__get_table(self.__shown)
+        for left, upper, right, lower in boxes:
+            self.__frame[upper:lower, left:right] = table[self.__indices[upper:lower, left:right]]
+        return [((left, upper),
+                 Image.fromarray(self.__frame[upper:lower, left:right].copy(), "RGBA"))
+                for left, upper, right, lower in boxes.tolist()]
+
+    def set_size(self, size):
+        """
+        Sets the size of the rendered frames.
+
+        The pixel to table mapping is resampled with the nearest neighbor method,
+        and only if the size differs from the current one, along with the label
+        image and the bounding boxes of the regions.
+
+        Parameters:
+        ------------
+        size : tuple
+            The width and height of the rendered frames.
+        """
+        width, height = max(1, size[0]), max(1, size[1])
+        if (width, height) != self.__size:
+            full_height, full_width = self.__indices_full.shape
+            rows = (np.arange(height) + 0.5) * full_height // height
+            columns = (np.arange(width) + 0.5) * full_width // width
+            self.__indices = self.__indices_full[rows.astype(np.intp)[:, None],
+                                                 columns.astype(np.intp)[None, :]]
+            self.__size = (width, height)
+
+            labels = (self.__indices // len(self.__palette)).astype(self.__labels.dtype)
+            self.__regions = labels
+            self.__boxes[:] = 0
+            for index in range(len(self.__boxes)):
+                rows = np.flatnonzero((labels == index + 1).any(axis=1))
+                if rows.size:
+                    columns = np.flatnonzero((labels[rows[0]:rows[-1] + 1] == index + 1).any(axis=0))
+                    self.__boxes[index] = (columns[0], rows[0], columns[-1] + 1, rows[-1] + 1)
+            self.__frame = None
+
+    def get_labels(self):
+        """
+        Returns the label image of the regions.
+
+        Returns:
+        ----------
+        numpy.ndarray :
+            Array giving, for each pixel, 0 outside the regions or the index of
+            the owning region plus one.
+        """
+        return self.__labels
+
+    def get_region(self, x, y):
+        """
+        Returns the index of the region displayed at the specified point.
+
+        Parameters:
+        ------------
+        x : int
+            The horizontal position of the point in the displayed frame.
+        y : int
+            The vertical position of the point in the displayed frame.
+
+        Returns:
+        ----------
+        int :
+            The index of the region, in the order of the region images, or None if
+            the point is outside the regions or the frame.
+        """
+        regions = self.__regions
+        if 0 <= y < regions.shape[0] and 0 <= x < regions.shape[1] and regions[y, x]:
+            return int(regions[y, x]) - 1
+        return None
+
+    def get_size(self):
+        """
+        Returns the size of the rendered frames.
+
+        Returns:
+        ----------
+        tuple :
+            The width and height of the rendered frames.
+        """
+        return self.__size
\ No newline at end of file
@@ -0,0 +1,121 @@
+import queue
+from threading import Condition, Thread
+
+class RenderWorker:
+    """
+    Class to build the frames of the world map on a background thread.
+
+    The worker reads the colors of the latest snapshot of the world, redraws the
+    regions whose color changed, and hands the redrawn parts over through a queue
+    holding a single update. An update that was not displayed in time is merged
+    with the newer one, so the interface thread only ever displays the most
+    recent frame and never waits for one to be built.
+
+    Attributes:
+    -----------
+    __condition : threading.Condition
+        Condition used to wake the worker thread when the size of the display changes.
+    __frames : queue.Queue
+        Queue holding the newest update not yet displayed, as a (size, parts) tuple.
+    __get_colors : function
+        Function returning the current colors of the regions.
+    __period : float
+        Duration in seconds between two checks for new colors.
+    __renderer : MapRenderer
+        Renderer building the frames.
+    __size : tuple
+        Size requested for the next frame, or None if it did not change.
+    __thread : threading.Thread
+        Thread building the frames.
+
+    Methods:
+    --------
+    __init__(renderer, get_colors, period=0.040):
+        Initializes a new instance of the RenderWorker class and starts its thread.
+    __run():
+        Thread that redraws the frame whenever the colors or the size change.
+    get_frame():
+        Returns the newest update of the frame, or None if there is no new update.
+    set_size(size):
+        Sets the size of the next frames.
+    """
+
+    __slots__ = ["__condition", "__frames", "__get_colors", "__period",
+                 "__renderer", "__size", "__thread"]
+
+    def __init__(self, renderer, get_colors, period=0.040):
+        """
+        Initializes a new instance of the RenderWorker class and starts its thread.
+
+        Parameters:
+        ------------
+        renderer : MapRenderer
+            The renderer building the frames.
+        get_colors : function
+            The function returning the current colors of the regions, without arguments.
+        period : float
+            The duration in seconds between two checks for new colors.
+        """
+        self.__condition = Condition()
+        self.__frames = queue.Queue(maxsize=1)
+        self.__get_colors = get_colors
+        self.__period = period
+        self.__renderer = renderer
+        self.__size = None
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        """
+        Thread that redraws the frame whenever the colors or the size change.
+        """
+        while True:
+            with self.__condition:
+                if self.__size is None:
+                    self.__condition.wait(self.__period)
+                size, self.__size = self.__size, None
+
+            if size is not None:
+                self.__renderer.set_size(size)
+            size = self.__renderer.get_size()
+            parts = self.__renderer.update(self.__get_colors())
+            if not parts:
+                continue
+
+            try:
+                previous_size, previous_parts = self.__frames.get_nowait()
+                if previous_size == size:
+                    parts = previous_parts + parts
+            except queue.Empty:
+                pass
+            self.__frames.put((size, parts))
+
+    def get_frame(self):
+        """
+        Returns the newest update of the frame, or None if there is no new update.
+
+        After a change of size, the first part of the update is the whole frame.
+
+        Returns:
+        ----------
+        tuple :
+            The size of the frame and the list of ((left, upper), PIL.Image.Image)
+            tuples giving the redrawn parts, or None if there is no new update.
+        """
+        try:
+            return self.__frames.get_nowait()
+        except queue.Empty:
+            return None
+
+    def set_size(self, size):
+        """
+        Sets the size of the next frames.
+
+        Parameters:
+        ------------
+        size : tuple
+            The width and height of the frames.
+        """
+        with self.__condition:
+            self.__size = size
+            self.__condition.notify()
\ No newline at end of file